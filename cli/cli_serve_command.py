@@ -20,7 +20,14 @@ def handle_serve_command(args) -> int:
         strict_validation=args.strict_validation
     )
 
+    import uvicorn
+
+    if args.reload:
+        # uvicorn can only reload an app given as an import string
+        print("⚠️  --reload is not supported for contract-built apps; ignoring.")
+
     print(f"🚀 Mock API server running at http://{args.host}:{args.port}")
-    app.run(host=args.host, port=args.port, use_reloader=args.reload)
+    # loop="auto" runs on uvloop (and httptools) whenever they are installed
+    uvicorn.run(app, host=args.host, port=args.port, loop="auto", http="auto")
 
     return 0
@@ -34,7 +34,8 @@ class ChaosSeedManager:
             self.request_counter += 1
             seed_string = f"{self.base_seed}:{route}:{method}:{self.request_counter}"
 
-        return int(hashlib.md5(seed_string.encode()).hexdigest(), 16) % (2**32)
+        # The low 32 bits of the digest, i.e. int(hexdigest, 16) % 2**32 without the hex round trip
+        return int.from_bytes(hashlib.md5(seed_string.encode()).digest()[-4:], "big")
 
     def get_request_rng(self, route: str, method: str, request_id: Optional[str] = None) -> random.Random:
         return random.Random(self.get_request_seed(route, method, request_id))
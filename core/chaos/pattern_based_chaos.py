@@ -1,5 +1,57 @@
+import operator
+
 from chaos.state_store import InMemoryStateStore
 
+
+def _contains(actual, expected):
+    return isinstance(actual, str) and expected in actual
+
+
+def _member(actual, expected):
+    try:
+        return actual in expected
+    except TypeError:  # unhashable value against a frozenset
+        return False
+
+
+def _never(actual, expected):
+    return False
+
+
+_OPERATORS = {
+    'equals': operator.eq,
+    'not_equals': operator.ne,
+    'contains': _contains,
+    'in': _member,
+    'gt': operator.gt,
+    'lt': operator.lt,
+}
+
+_MISSING = object()
+
+
+def _compile_conditions(conditions):
+    """
+    Split field paths and resolve operators up front:
+    ((field path parts, expected, compare), ...).
+    """
+    compiled = []
+    for condition in conditions:
+        parts = tuple(condition.get('field', '').split("."))
+        expected = condition.get('value')
+        compare = _OPERATORS.get(condition.get('operator', 'equals'), _never)
+        if compare is _member:
+            if isinstance(expected, (list, set)):
+                try:
+                    expected = frozenset(expected)
+                except TypeError:
+                    pass  # unhashable members: keep the list
+            else:
+                compare = _never
+        compiled.append((parts, expected, compare))
+
+    return tuple(compiled)
+
 class PatternBasedChaos:
     """
     Implements deterministic chaos patterns that follow specific sequences.
@@ -20,66 +72,64 @@ class PatternBasedChaos:
         """
         self.pattern_config = pattern_config
         self.state_store = state_store or InMemoryStateStore()
+        # (conditions list, its compiled form); rebuilt when pattern_config
+        # is swapped for one with other conditions
+        self._compiled_conditions = None
 
     def should_trigger(self, route, method, request_context=None):
         """Determine if chaos should trigger for this request."""
-        pattern_type = self.pattern_config.get('type')
-
-        if pattern_type == 'sequence':
-            return self._evaluate_sequence_pattern(route, method)
-        elif pattern_type == 'nth':
-            return self._evaluate_nth_pattern(route, method)
-        elif pattern_type == 'conditional':
-            return self._evaluate_conditional_pattern(route, method, request_context)
+        handler = self._DISPATCH.get(self.pattern_config.get('type'))
+        return handler(self, route, method, request_context) if handler else False
 
-        return False
-
-    def _evaluate_sequence_pattern(self, route, method):
-        key = f"{route}:{method}:sequence_index"
-        index = self.state_store.get(key, 0)
+    def _evaluate_sequence_pattern(self, route, method, request_context=None):
         sequence = self.pattern_config.get('sequence', [])
 
         if not sequence:
             return False
 
-        should_trigger = bool(sequence[index % len(sequence)])
-        self.state_store.set(key, (index + 1) % len(sequence))
-        return should_trigger
+        # The counter keeps running; the position is taken modulo the sequence length
+        index = self.state_store.increment((route, method, "sequence_index")) - 1
+        return bool(sequence[index % len(sequence)])
 
-    def _evaluate_nth_pattern(self, route, method):
-        key = f"{route}:{method}:request_count"
-        count = self.state_store.get(key, 0) + 1
-        self.state_store.set(key, count)
+    def _evaluate_nth_pattern(self, route, method, request_context=None):
+        count = self.state_store.increment((route, method, "request_count"))
 
         n = self.pattern_config.get('n', 1)
         offset = self.pattern_config.get('offset', 0)
 
         return (count - offset) % n == 0
 
-    def _evaluate_conditional_pattern(self, route, method, request_context):
+    def _evaluate_conditional_pattern(self, route, method, request_context=None):
         conditions = self.pattern_config.get('conditions', [])
         if not conditions or not request_context:
             return False
 
-        for condition in conditions:
-            field = condition.get('field', '')
-            expected = condition.get('value')
-            operator = condition.get('operator', 'equals')
+        cached = self._compiled_conditions
+        if cached is None or cached[0] is not conditions:
+            cached = self._compiled_conditions = (conditions, _compile_conditions(conditions))
 
-            actual = self._extract_field_value(request_context, field)
-            if not self._compare_values(actual, expected, operator):
+        for parts, expected, compare in cached[1]:
+            if not compare(self._extract_field_value(request_context, parts), expected):
                 return False
 
         return True
 
-    def _extract_field_value(self, context, field_path):
-        """Extract nested value from dict using dot notation (e.g., headers.User-Agent)."""
-        parts = field_path.split(".")
+    # pattern type -> evaluator, all called as (self, route, method, request_context)
+    _DISPATCH = {
+        'sequence': _evaluate_sequence_pattern,
+        'nth': _evaluate_nth_pattern,
+        'conditional': _evaluate_conditional_pattern,
+    }
+
+    def _extract_field_value(self, context, parts):
+        """
+        Extract nested value from dict by a pre-split dotted path
+        (e.g., ('headers', 'User-Agent') for headers.User-Agent).
+        """
         value = context
         for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
+            value = value.get(part, _MISSING) if isinstance(value, dict) else _MISSING
+            if value is _MISSING:
                 return None
         return value
 
@@ -109,6 +159,7 @@ class PatternBasedChaos:
         """
         if route is None and method is None:
             self.state_store.clear()
+        elif method is None:
+            self.state_store.clear_with_prefix((route,))
         else:
-            prefix = f"{route or ''}:{method or ''}"
-            self.state_store.clear_with_prefix(prefix)
+            self.state_store.clear_with_prefix((route or '', method))
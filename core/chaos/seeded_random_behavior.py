@@ -37,9 +37,7 @@ class SeededRandomBehavior:
         if request_id:
             seed = self._hash_seed(f"{self.base_seed}:{route}:{method}:{request_id}")
         else:
-            key = f"{route}:{method}:request_counter"
-            counter = self.state_store.get(key, 0)
-            self.state_store.set(key, counter + 1)
+            counter = self.state_store.increment((route, method, "request_counter")) - 1
             seed = self._hash_seed(f"{self.base_seed}:{route}:{method}:{counter}")
 
         return random.Random(seed)
@@ -9,12 +9,24 @@ class StateStore:
         """Set a value by key."""
         raise NotImplementedError
     
+    def increment(self, key, delta=1):
+        """Add delta to a counter (missing counts as 0) and return the new value."""
+        value = self.get(key, 0) + delta
+        self.set(key, value)
+        return value
+
     def clear(self):
         """Clear all state."""
         raise NotImplementedError
     
     def clear_with_prefix(self, prefix):
-        """Clear all state with keys matching the prefix."""
+        """
+        Clear all state with keys matching the prefix.
+
+        A str prefix matches str keys that start with it; a tuple prefix
+        matches tuple keys, such as (route, method, counter), that start
+        with its items.
+        """
         raise NotImplementedError
 
 class InMemoryStateStore(StateStore):
@@ -28,9 +40,18 @@ class InMemoryStateStore(StateStore):
     
     def set(self, key, value):
         self.state[key] = value
+
+    def increment(self, key, delta=1):
+        state = self.state
+        value = state[key] = state.get(key, 0) + delta
+        return value
     
     def clear(self):
         self.state.clear()
     
     def clear_with_prefix(self, prefix):
-        self.state = {k: v for k, v in self.state.items() if not k.startswith(prefix)}
\ No newline at end of file
+        if isinstance(prefix, tuple):
+            n = len(prefix)
+            self.state = {k: v for k, v in self.state.items() if not (isinstance(k, tuple) and k[:n] == prefix)}
+        else:
+            self.state = {k: v for k, v in self.state.items() if not (isinstance(k, str) and k.startswith(prefix))}
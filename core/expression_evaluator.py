@@ -1,13 +1,22 @@
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from pydantic import BaseModel, Field, validator, root_validator
 import yaml
 import os
 import glob
+import mmap
 from pathlib import Path
 import uuid
 import re
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Files larger than this are mapped into memory instead of read into a buffer
+MMAP_THRESHOLD = 256 * 1024
+
 
 class HttpMethod(str, Enum):
     GET = "GET"
@@ -82,6 +91,12 @@ class ContractEntry(BaseModel):
         return values
 
 
+def _copy(model):
+    """An independent deep copy of a model."""
+    model_copy = getattr(model, "model_copy", None) or model.copy
+    return model_copy(deep=True)
+
+
 class ContractLoadError(Exception):
     pass
 
@@ -93,6 +108,8 @@ class ContractConflictError(Exception):
 class ContractLoader:
     def __init__(self):
         self.conflicts_detected = False
+        # resolved path -> (st_mtime_ns, st_size, contracts)
+        self._file_cache: Dict[str, Tuple[int, int, List[ContractEntry]]] = {}
     
     def load_contracts(self, source, allow_duplicates=False):
         """
@@ -121,11 +138,36 @@ class ContractLoader:
             raise ContractLoadError(f"Source not found: {source}")
     
     def _load_from_file(self, file_path, allow_duplicates):
-        """Load contracts from a single file"""
+        """
+        Load contracts from a single file.
+
+        Parsed entries are memoized per file and reused while its mtime and
+        size are unchanged. Every call gets deep copies, so callers may modify
+        what they are given without touching the cache.
+        """
         try:
-            with open(file_path, 'r') as file:
-                content = yaml.safe_load(file)
-                return self._load_from_dict(content, allow_duplicates)
+            file_path = Path(file_path)
+            stat = file_path.stat()
+            cache_key = str(file_path.resolve())
+            cached = self._file_cache.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                contracts = [_copy(contract) for contract in cached[2]]
+                if not allow_duplicates:
+                    self._check_for_duplicates(contracts)
+                    if self.conflicts_detected:
+                        raise ContractConflictError("Duplicate routes detected in contract data")
+                return contracts
+
+            # Hand raw bytes to the (C) YAML parser instead of decoding in Python first
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size > MMAP_THRESHOLD:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                        content = yaml.load(buf, Loader=_YamlLoader)
+                else:
+                    content = yaml.load(file.read(), Loader=_YamlLoader)
+            contracts = self._load_from_dict(content, allow_duplicates)
+            self._file_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, contracts)
+            return [_copy(contract) for contract in contracts]
         except yaml.YAMLError as e:
             raise ContractLoadError(f"Invalid YAML in {file_path}: {str(e)}")
         except Exception as e:
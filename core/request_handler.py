@@ -5,6 +5,11 @@ from contract.contract_entry import ContractEntry
 from schema.strict_validator import StrictSchemaValidator  # Ensure proper import
 from registry.route_registry import RouteRegistry
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def handle_request(request, registry: RouteRegistry):
     """
@@ -31,11 +36,12 @@ def handle_request(request, registry: RouteRegistry):
 
     contract = route_match.contract
 
-    # Parse the request body if present
+    # Parse the request body if present. Schema validation is its only
+    # consumer, so routes without a request body schema never parse it.
     request_body = None
-    if request.body:
+    if request.body and contract.request_body_schema:
         try:
-            request_body = json.loads(request.body)
+            request_body = _json_loads(request.body)
         except json.JSONDecodeError as e:
             return {
                 "status_code": 400,
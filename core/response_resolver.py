@@ -16,6 +16,33 @@ from contract.contract_response import ContractResponse, TemplatedResponse
 
 app = APIRouter()
 
+# Returned by _fetch when a context path cannot be resolved
+_MISSING = object()
+
+
+def _fetch(evaluator: 'ConditionEvaluator', path_tokens, context: Dict[str, Any]) -> Any:
+    try:
+        return evaluator._get_context_value(path_tokens, context)
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return _MISSING
+
+
+def _ordered(compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    """Wrap an ordering/containment operator so mismatched types compare as False."""
+    def op(x: Any, y: Any) -> bool:
+        try:
+            return compare(x, y)
+        except TypeError:
+            return False
+    return op
+
+
+def _matches(x: Any, y: Any) -> bool:
+    try:
+        return bool(re.match(str(y), str(x)))
+    except re.error:
+        return False
+
 
 class CompiledCondition:
     def __init__(self, condition_str: str, evaluator: 'ConditionEvaluator'):
@@ -57,28 +84,33 @@ class CompiledCondition:
         op_func = evaluator._operators.get(operator_value)
         if not op_func:
             return lambda _: False
+        # Unresolvable operands only satisfy 'empty'
+        missing_result = operator_value == 'empty'
         if operator_value in ('exists', 'empty'):
             def predicate(context: Dict[str, Any]) -> bool:
-                left_value = evaluator._get_context_value(left_tokens, context)
+                left_value = _fetch(evaluator, left_tokens, context)
+                if left_value is _MISSING:
+                    return missing_result
                 return op_func(left_value, None)
             return predicate
         if right_tokens and right_tokens[0][0] == TokenType.VALUE:
             right_value = evaluator._parse_value(right_tokens[0][1])
             def predicate(context: Dict[str, Any]) -> bool:
-                left_value = evaluator._get_context_value(left_tokens, context)
+                left_value = _fetch(evaluator, left_tokens, context)
+                if left_value is _MISSING:
+                    return missing_result
                 return op_func(left_value, right_value)
         else:
             def predicate(context: Dict[str, Any]) -> bool:
-                left_value = evaluator._get_context_value(left_tokens, context)
-                right_value = evaluator._get_context_value(right_tokens, context)
+                left_value = _fetch(evaluator, left_tokens, context)
+                right_value = _fetch(evaluator, right_tokens, context)
+                if left_value is _MISSING or right_value is _MISSING:
+                    return missing_result
                 return op_func(left_value, right_value)
         return predicate
 
     def evaluate(self, context: Dict[str, Any]) -> bool:
-        try:
-            return self.predicate(context)
-        except Exception:
-            return False
+        return self.predicate(context)
 
     def __str__(self) -> str:
         return f"CompiledCondition({self.original_condition})"
@@ -91,17 +123,17 @@ class ConditionEvaluator:
             'eq': lambda x, y: x == y,
             '!=': lambda x, y: x != y,
             'ne': lambda x, y: x != y,
-            '>': lambda x, y: x > y,
-            'gt': lambda x, y: x > y,
-            '<': lambda x, y: x < y,
-            'lt': lambda x, y: x < y,
-            '>=': lambda x, y: x >= y,
-            'ge': lambda x, y: x >= y,
-            '<=': lambda x, y: x <= y,
-            'le': lambda x, y: x <= y,
-            'in': lambda x, y: x in y,
-            'contains': lambda x, y: y in x,
-            'matches': lambda x, y: bool(re.match(str(y), str(x))),
+            '>': _ordered(lambda x, y: x > y),
+            'gt': _ordered(lambda x, y: x > y),
+            '<': _ordered(lambda x, y: x < y),
+            'lt': _ordered(lambda x, y: x < y),
+            '>=': _ordered(lambda x, y: x >= y),
+            'ge': _ordered(lambda x, y: x >= y),
+            '<=': _ordered(lambda x, y: x <= y),
+            'le': _ordered(lambda x, y: x <= y),
+            'in': _ordered(lambda x, y: x in y),
+            'contains': _ordered(lambda x, y: y in x),
+            'matches': _matches,
             'exists': lambda x, _: x is not None,
             'empty': lambda x, _: not bool(x) if x is not None else True,
         }
@@ -5,11 +5,31 @@ from typing import Dict, Any, List, Optional, Union, Set, Tuple
 import json
 import colorama
 from colorama import Fore, Style
+from dataclasses import dataclass
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 import time
 
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    # Same compact UTF-8 output as orjson
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Every JSON response body, compiled or resolved, is serialized by _json_dumps
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # e.g. non-str keys or ints beyond 64 bits
+            return _stdlib_json_dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
 from contract.contract_loader import ContractLoader
 from contract.contract_entry import ContractEntry
 from router.trie_matcher import TrieRouteRegistry
@@ -19,6 +39,60 @@ from core.debug_logger import DebugLogger
 
 colorama.init()
 
+
+@dataclass(frozen=True)
+class CompiledResponse:
+    """A static response rendered once at startup and replayed verbatim."""
+    status: int
+    headers: Dict[str, str]
+    body_bytes: bytes
+    content_type: Optional[str]
+
+    @classmethod
+    def from_response(cls, response: Any) -> Optional["CompiledResponse"]:
+        """Compile a contract response, or return None if it must be resolved per request."""
+        if response is None or getattr(response, "variants", None):
+            return None
+
+        body = response.body
+        headers = dict(response.headers or {})
+        if isinstance(body, (dict, list)):
+            body_bytes = _json_dumps(body)
+        elif isinstance(body, str):
+            body_bytes = body.encode("utf-8")
+        elif body is None:
+            body_bytes = b""
+        else:
+            return None
+
+        # Templated bodies/headers still go through the resolver.
+        if b"{{" in body_bytes or any("{{" in str(v) for v in headers.values()):
+            return None
+
+        content_type = None
+        for name in list(headers):
+            if name.lower() == "content-type":
+                content_type = headers.pop(name)
+                break
+        if content_type is None and isinstance(body, (dict, list)):
+            content_type = "application/json"
+
+        return cls(
+            status=response.status or 200,
+            headers=headers,
+            body_bytes=body_bytes,
+            content_type=content_type,
+        )
+
+    def render(self) -> Response:
+        return Response(
+            content=self.body_bytes,
+            status_code=self.status,
+            headers=self.headers,
+            media_type=self.content_type,
+        )
+
+
 class MockServer:
     def __init__(self, 
                  contracts: List[ContractEntry],
@@ -30,8 +104,12 @@ class MockServer:
         self.debug_matching = debug_matching
 
         self.registry = TrieRouteRegistry() if use_trie else RouteRegistry()
+        self._compiled_responses: Dict[int, CompiledResponse] = {}
         for contract in contracts:
             self.registry.register(contract)
+            compiled = CompiledResponse.from_response(getattr(contract, "response", None))
+            if compiled is not None:
+                self._compiled_responses[id(contract)] = compiled
 
         self.debug_logger = DebugLogger(enabled=debug_matching, level="DEBUG" if debug_matching else "INFO")
 
@@ -44,22 +122,36 @@ class MockServer:
 
     def _create_app(self) -> FastAPI:
         app = FastAPI(title="Mock API Server")
+        # Debug logging is fixed for the lifetime of the app; all timing and
+        # request-id bookkeeping is skipped when it is off.
+        dbg = self.debug_matching
+        debug_logger = self.debug_logger
 
         @app.api_route("/{full_path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
         async def handle_request(request: Request, full_path: str):
-            start_time = time.time()
             path = f"/{full_path}" if not full_path.startswith("/") else full_path
             method = request.method
 
-            request_id = self.debug_logger.request_start(method, path)
+            request_id = None
+            if dbg:
+                start = time.perf_counter_ns()
+                request_id = debug_logger.request_start(method, path)
             match_result = self.registry.match(method, path)
 
             if not match_result:
-                self.debug_logger.request_complete(request_id, 404, (time.time() - start_time) * 1000)
+                if dbg:
+                    debug_logger.request_complete(request_id, 404, (time.perf_counter_ns() - start) / 1_000_000)
                 return JSONResponse(status_code=404, content={"error": f"No mock defined for {method} {path}"})
 
             contract_entry, path_params = match_result.contract, match_result.params
-            self.debug_logger.route_match(request_id, contract_entry.path, path_params)
+            if dbg:
+                debug_logger.route_match(request_id, contract_entry.path, path_params)
+
+            compiled = self._compiled_responses.get(id(contract_entry))
+            if compiled is not None and not self.strict_validation:
+                if dbg:
+                    debug_logger.request_complete(request_id, compiled.status, (time.perf_counter_ns() - start) / 1_000_000)
+                return compiled.render()
 
             request_data = await self._build_request_data(request, path_params)
 
@@ -74,32 +166,42 @@ class MockServer:
 
                 content = body
                 if isinstance(body, (dict, list)):
-                    content = json.dumps(body)
+                    content = _json_dumps(body)
                     if "content-type" not in {k.lower(): v for k, v in headers.items()}:
                         headers["Content-Type"] = "application/json"
 
-                self.debug_logger.request_complete(request_id, status, (time.time() - start_time) * 1000)
+                if dbg:
+                    debug_logger.request_complete(request_id, status, (time.perf_counter_ns() - start) / 1_000_000)
                 return Response(content=content, status_code=status, headers=headers)
 
             except Exception as e:
-                self.debug_logger.request_complete(request_id, 500, (time.time() - start_time) * 1000)
+                if dbg:
+                    debug_logger.request_complete(request_id, 500, (time.perf_counter_ns() - start) / 1_000_000)
                 return JSONResponse(status_code=500, content={"error": "Error resolving mock response", "message": str(e)})
 
         return app
 
     async def _build_request_data(self, request: Request, path_params: Dict[str, str]) -> Dict[str, Any]:
+        # Read the raw bytes once; parse only JSON bodies and keep the bytes
+        # around so downstream consumers never have to re-read or re-parse.
+        method = request.method
         body = {}
-        try:
-            body = await request.json()
-        except Exception:
-            pass
+        raw_body = b""
+        if method not in ("GET", "HEAD"):
+            raw_body = await request.body()
+            if raw_body and "application/json" in request.headers.get("content-type", ""):
+                try:
+                    body = _json_loads(raw_body)
+                except ValueError:
+                    pass
 
         return {
-            "method": request.method,
+            "method": method,
             "path": str(request.url.path),
             "headers": dict(request.headers),
             "query": dict(request.query_params),
             "body": body,
+            "raw_body": raw_body,
             "params": path_params,
         }
 
@@ -1,49 +1,153 @@
 # core/server_factory.py
 
+import asyncio
+import os
+from types import SimpleNamespace
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from registry.route_registry import RouteRegistry
 from core.request_handler import handle_request
+from schema.strict_validator import StrictSchemaValidator
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+try:
+    from fastapi.responses import ORJSONResponse as JSONResponse
+    import orjson  # noqa: F401  (ORJSONResponse needs it at render time)
+except ImportError:
+    from starlette.responses import JSONResponse
+
+# Seconds to wait for a complete request body; unset means wait indefinitely
+BODY_READ_TIMEOUT = float(os.environ["MOCKAPI_BODY_TIMEOUT_SECONDS"]) if os.environ.get("MOCKAPI_BODY_TIMEOUT_SECONDS") else None
+
+_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
 
+_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
 
-def create_server(contracts, use_trie=True, strict_validation=False):
+# Preflight answer for the fixed allow-all policy, rendered once at import
+_PREFLIGHT_HEADERS = (
+    _ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"2"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+)
+
+
+class AllowAllCORSMiddleware:
     """
-    Creates and configures a FastAPI app from contract definitions.
+    ASGI middleware equivalent to CORSMiddleware with every origin, method and
+    header allowed. Since nothing is configurable, preflights are answered from
+    a precomputed header list instead of re-evaluating the policy per request.
     """
-    app = FastAPI(title="Mock API Server")
 
-    # Add basic CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        has_origin = is_preflight = False
+        requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                has_origin = True
+            elif name == b"access-control-request-method":
+                is_preflight = True
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        if not has_origin:
+            await self.app(scope, receive, send)
+            return
+
+        if is_preflight and scope["method"] == "OPTIONS":
+            headers = list(_PREFLIGHT_HEADERS)
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), _ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
 
+def create_server(contracts, use_trie=True, strict_validation=False, ultralight=False):
+    """
+    Creates and configures an ASGI app from contract definitions.
+
+    By default this is a FastAPI app. With ``ultralight=True`` the catch-all
+    route is mounted on a bare Starlette app instead, skipping FastAPI's
+    dependency resolution and OpenAPI machinery, which it never uses.
+
+    Returns the app and an ``asyncio.Event`` that is set on shutdown.
+    """
     # Initialize registry
     registry = RouteRegistry()
     for contract in contracts:
         registry.register(contract, use_trie=use_trie)
+    # handle_request validates strictly; build those validators before serving
+    StrictSchemaValidator.warm_validators(contracts, strict=True)
 
-    @app.api_route("/{full_path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
     async def handle_all_routes(request: Request):
         """
         Catch-all route that handles any method/path and dispatches to our custom handler.
         """
-        body = await request.body()
+        try:
+            body = await asyncio.wait_for(request.body(), BODY_READ_TIMEOUT)
+        except asyncio.TimeoutError:
+            return JSONResponse(
+                status_code=408,
+                content={"error": "Request Timeout", "message": "Timed out reading request body"},
+            )
+
+        # Starlette's Headers/QueryParams are already read-only mappings, and
+        # json.loads accepts bytes, so nothing is copied or decoded up front.
         response = handle_request(
-            request={
-                "method": request.method,
-                "path": "/" + request.path_params["full_path"],
-                "headers": dict(request.headers),
-                "body": body.decode("utf-8") if body else None,
-                "query_params": dict(request.query_params)
-            },
+            request=SimpleNamespace(
+                method=request.method,
+                path="/" + request.path_params["full_path"],
+                headers=request.headers,
+                body=body,
+                query_params=request.query_params,
+            ),
             registry=registry
         )
         return JSONResponse(status_code=response["status_code"], content=response["body"])
 
-    shutdown_event = None  # Placeholder
+    shutdown_event = asyncio.Event()
+
+    if ultralight:
+        app = Starlette(
+            routes=[Route("/{full_path:path}", handle_all_routes, methods=_METHODS)],
+            middleware=[Middleware(AllowAllCORSMiddleware)],
+            on_shutdown=[shutdown_event.set],
+        )
+        return app, shutdown_event
+
+    app = FastAPI(
+        title="Mock API Server",
+        default_response_class=JSONResponse,
+        on_shutdown=[shutdown_event.set],
+    )
+
+    # Add basic CORS middleware
+    app.add_middleware(AllowAllCORSMiddleware)
+
+    app.add_api_route(
+        "/{full_path:path}",
+        handle_all_routes,
+        methods=_METHODS,
+        include_in_schema=False,
+    )
+
     return app, shutdown_event
@@ -1,9 +1,16 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 class TestCoverageAnalyzer:
     def get_route_coverage(self, method: str, path: str) -> Dict:
         raise NotImplementedError
 
+    def get_route_coverage_bulk(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """
+        Coverage for many (method, path) pairs at once. Backends that can fetch
+        in one round trip should override this; the default just loops.
+        """
+        return {key: self.get_route_coverage(*key) for key in keys}
+
     def get_affected_tests(self, affected_routes: List[str]) -> List[str]:
         raise NotImplementedError
 
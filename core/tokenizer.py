@@ -1,9 +1,9 @@
-from enum import Enum
+from enum import IntEnum
 
-class TokenType(Enum):
-    FIELD = "FIELD"
-    VALUE = "VALUE"
-    OPERATOR = "OPERATOR"
-    ARRAY_ACCESS = "ARRAY_ACCESS"
-    DOT = "DOT"
-    UNKNOWN = "UNKNOWN"
+class TokenType(IntEnum):
+    FIELD = 0
+    VALUE = 1
+    OPERATOR = 2
+    ARRAY_ACCESS = 3
+    DOT = 4
+    UNKNOWN = 5
@@ -1,17 +1,23 @@
-from typing import Dict
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
 
-class UsageStats:
-    def __init__(self, call_count, unique_clients, last_used, success_rate, avg_response_time, parameter_frequencies):
-        self.call_count = call_count
-        self.unique_clients = unique_clients
-        self.last_used = last_used
-        self.success_rate = success_rate
-        self.avg_response_time = avg_response_time
-        self.parameter_frequencies = parameter_frequencies
+class UsageStats(NamedTuple):
+    call_count: int
+    unique_clients: int
+    last_used: float
+    success_rate: float
+    avg_response_time: float
+    parameter_frequencies: Dict
 
 class UsageDataProcessor:
     def get_route_usage(self, method: str, path: str) -> UsageStats:
         raise NotImplementedError
 
+    def get_route_usage_bulk(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[UsageStats]]:
+        """
+        Usage for many (method, path) pairs at once. Backends that can fetch
+        in one round trip should override this; the default just loops.
+        """
+        return {key: self.get_route_usage(*key) for key in keys}
+
     def get_client_impact(self, affected_routes: list) -> Dict:
         raise NotImplementedError
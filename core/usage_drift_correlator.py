@@ -1,3 +1,17 @@
+from bisect import bisect_right
+from datetime import datetime
+
+
+def _timestamp(record) -> float:
+    """Epoch seconds for a usage entry or contract change (dict or object)."""
+    value = record.get("timestamp") if isinstance(record, dict) else getattr(record, "timestamp")
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
 class UsageDriftCorrelator:
     def __init__(self, session_recorder, contract_analyzer):
         self.session_recorder = session_recorder
@@ -18,4 +32,26 @@ class UsageDriftCorrelator:
         endpoint_changes = self.contract_analyzer.get_endpoint_history(endpoint_path)
         endpoint_usage = self.session_recorder.get_endpoint_usage(endpoint_path)
         
-        return self._correlate_changes_with_usage(endpoint_changes, endpoint_usage)
\ No newline at end of file
+        return self._correlate_changes_with_usage(endpoint_changes, endpoint_usage)
+
+    def _map_usage_to_contracts(self, usage_logs, contract_changes):
+        """
+        Assign each usage entry to the contract change in effect when it happened.
+
+        Changes are sorted once and every entry is placed with a binary search,
+        so the join is O(n log m) rather than comparing every entry against
+        every change. Entries older than the first change are not attributed.
+        """
+        changes = sorted(contract_changes, key=_timestamp)
+        change_times = [_timestamp(change) for change in changes]
+        buckets = [[] for _ in changes]
+
+        for entry in usage_logs:
+            index = bisect_right(change_times, _timestamp(entry)) - 1
+            if index >= 0:
+                buckets[index].append(entry)
+
+        return [
+            {"change": change, "usage": usage, "call_count": len(usage)}
+            for change, usage in zip(changes, buckets)
+        ]
@@ -1,95 +1,300 @@
-import argparse
+import importlib
 import sys
 import os
+from types import SimpleNamespace
 
-# Patch sys.path for local imports
-ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
-if ROOT_DIR not in sys.path:
-    sys.path.insert(0, ROOT_DIR)
-
-# --- Safe Imports from CLI handlers ---
-from cli.cli_serve_command import handle_serve_command
-
-try:
-    from cli.cli_validate_command import handle_validate_command
-except ImportError:
-    def handle_validate_command(args):
-        print("❌ 'validate' command is currently unavailable.")
-        return 1
-
-try:
-    from cli.cli_validator import handle_check_compatibility
-except ImportError:
-    def handle_check_compatibility(args):
-        print("❌ 'check-compatibility' command is unavailable.")
-        return 1
-
-try:
-    from cli.cli_json_exporter import handle_export_diff_as_json
-except ImportError:
-    def handle_export_diff_as_json(args):
-        print("❌ 'export-json' command is unavailable.")
-        return 1
-
-try:
-    from cli.cli_validator_updated import handle_enhanced_validator
-except ImportError:
-    def handle_enhanced_validator(args):
-        print("❌ 'validate-enhanced' command is unavailable.")
-        return 1
+__version__ = "1.0.0"
 
-try:
-    from cli.cli_diff_command import handle_diff_command
-except ImportError:
-    def handle_diff_command(args):
-        print("❌ 'diff' command is unavailable.")
-        return 1
+ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
 
-try:
-    from cli.cli_chaos_flags import apply_chaos_cli_overrides
-except ImportError:
-    def apply_chaos_cli_overrides(args, config):
+# Choice sets: dicts keep declaration order for help output while giving
+# argparse (and the fast path below) hashed membership checks.
+_SEVERITIES = dict.fromkeys(["HIGH", "MEDIUM", "LOW", "INFO"])
+_DIFF_FORMATS = dict.fromkeys(["table", "json"])
+_REPORT_FORMATS = dict.fromkeys(["html", "markdown", "json", "terminal"])
+_REPORT_FOCUS = dict.fromkeys(["coverage", "chaos", "contract", "performance"])
+
+# --- Command registry ---
+# Each command is described by data only: its help text, argparse arguments and
+# the (module, function) that implements it. Handler modules pull in heavy
+# dependencies (FastAPI, jsonschema, click, ...), so they are imported only when
+# their command actually runs. A handler of None marks a JS-only or unimplemented
+# command that just reports it is unavailable.
+COMMANDS = {
+    "validate": {
+        "help": "Validate contract files",
+        "args": [
+            ("path", {"type": str, "help": "Path to contract file or directory"}),
+        ],
+        "handler": ("cli.cli_validate_command", "handle_validate_command"),
+        "unavailable": "❌ 'validate' command is currently unavailable.",
+    },
+    "serve": {
+        "help": "Start the mock API server with chaos/test support",
+        "args": [
+            ("contract_path", {"type": str}),
+            ("--host", {"type": str, "default": "127.0.0.1"}),
+            ("--port", {"type": int, "default": 8080}),
+            ("--reload", {"action": "store_true"}),
+            ("--strict-validation", {"action": "store_true"}),
+            ("--chaos-seed", {"type": int}),
+            ("--force-delay", {"nargs": "*"}),
+            ("--force-error", {"nargs": "*"}),
+        ],
+        "handler": ("cli.cli_serve_command", "handle_serve_command"),
+        "unavailable": "❌ 'serve' command is unavailable.",
+    },
+    "check-compatibility": {
+        "help": "Compare old/new contracts for breaking changes",
+        "args": [
+            ("--from", {"dest": "from_file", "required": True}),
+            ("--to", {"dest": "to_file", "required": True}),
+            ("--include-non-breaking", {"action": "store_true"}),
+            ("--severity", {"default": "HIGH", "choices": _SEVERITIES}),
+            ("--json-output", {"action": "store_true"}),
+            ("--quiet", {"action": "store_true"}),
+        ],
+        "handler": ("cli.cli_validator", "handle_check_compatibility"),
+        "unavailable": "❌ 'check-compatibility' command is unavailable.",
+    },
+    "export-json": {
+        "help": "Output a structured diff as JSON",
+        "args": [
+            ("--from", {"dest": "from_file", "required": True}),
+            ("--to", {"dest": "to_file", "required": True}),
+            ("--output", {"required": True}),
+        ],
+        "handler": ("cli.cli_json_exporter", "handle_export_diff_as_json"),
+        "unavailable": "❌ 'export-json' command is unavailable.",
+    },
+    "validate-enhanced": {
+        "help": "Run strict validation using schema + filters",
+        "args": [
+            ("path", {"type": str}),
+        ],
+        "handler": ("cli.cli_validator_updated", "handle_enhanced_validator"),
+        "unavailable": "❌ 'validate-enhanced' command is unavailable.",
+    },
+    "diff": {
+        "help": "Summarize contract drift between versions",
+        "args": [
+            ("base", {"help": "Base contract YAML file"}),
+            ("target", {"help": "Target contract YAML file"}),
+            ("--format", {"choices": _DIFF_FORMATS, "default": "table"}),
+            ("--check-deprecated", {"action": "store_true"}),
+            ("--deprecation-report", {"action": "store_true"}),
+            ("--import-usage-data", {}),
+            ("--deprecation-exit-code", {"action": "store_true"}),
+        ],
+        "handler": ("cli.cli_diff_command", "handle_diff_command"),
+        "unavailable": "❌ 'diff' command is unavailable.",
+    },
+    "report-compare": {
+        "help": "Compare historical report files (HTML, JSON, Markdown)",
+        "args": [
+            ("base_report", {}),
+            ("current_report", {}),
+            ("--format", {"choices": _REPORT_FORMATS, "default": "terminal"}),
+            ("--output", {}),
+            ("--focus", {"nargs": "*", "choices": _REPORT_FOCUS}),
+            ("--threshold", {"type": float, "default": 5.0}),
+            ("--include-improved", {"action": "store_true", "default": True}),
+            ("--summary-only", {"action": "store_true"}),
+        ],
+        "handler": ("cli.cli_report_compare", "compare_reports"),
+        "unavailable": "❌ 'report compare' command is unavailable.",
+    },
+    # JS-only commands
+    "replay": {
+        "help": "Replay a session against a contract (JS-only)",
+        "args": [
+            ("session_file", {"type": str}),
+            ("--contract", {"required": True}),
+            ("--strict", {"action": "store_true"}),
+        ],
+        "handler": None,
+        "unavailable": "❌ 'replay' command is unavailable (JS-only).",
+    },
+    "tag-session": {
+        "help": "Add metadata tags to a session (JS-only)",
+        "args": [
+            ("session_file", {"type": str}),
+            ("--tags", {"required": True}),
+        ],
+        "handler": None,
+        "unavailable": "❌ 'tag-session' command is unavailable (JS-only).",
+    },
+    "filter-replay": {
+        "help": "Replay sessions with filtering (JS-only)",
+        "args": [
+            ("session_file", {"type": str}),
+            ("--method", {}),
+            ("--route", {}),
+        ],
+        "handler": None,
+        "unavailable": "❌ 'filter-replay' command is unavailable (JS-only).",
+    },
+    "test-diff-scenarios": {
+        "help": "Run or generate test scenarios for diffing",
+        "args": [
+            ("--create", {"action": "store_true"}),
+        ],
+        "handler": None,
+        "unavailable": "❌ 'test-diff-scenarios' is not implemented.",
+    },
+}
+
+
+def apply_chaos_cli_overrides(args, config):
+    try:
+        from cli.cli_chaos_flags import apply_chaos_cli_overrides as impl
+    except ImportError:
         print("⚠️  Chaos CLI override support not available.")
         return config
+    return impl(args, config)
 
-try:
-    from cli.cli_report_compare import compare_reports as handle_report_compare
-except ImportError:
-    def handle_report_compare(args):
-        print("❌ 'report compare' command is unavailable.")
-        return 1
 
-# JS-only CLI handlers
-def handle_replay_session(args):
-    print("❌ 'replay' command is unavailable (JS-only).")
-    return 1
-
-def handle_tag_session(args):
-    print("❌ 'tag-session' command is unavailable (JS-only).")
-    return 1
+def dispatch(args) -> int:
+    """Import the selected command's handler and run it."""
+    spec = COMMANDS[args.command]
+    if spec["handler"] is None:
+        print(spec["unavailable"])
+        return 1
 
-def handle_filter_replay(args):
-    print("❌ 'filter-replay' command is unavailable (JS-only).")
-    return 1
+    module_name, func_name = spec["handler"]
+    try:
+        handler = getattr(importlib.import_module(module_name), func_name)
+    except (ImportError, AttributeError):
+        print(spec["unavailable"])
+        return 1
+    return handler(args)
 
-def handle_test_diff_scenarios(args):
-    print("❌ 'test-diff-scenarios' is not implemented.")
-    return 1
 
 # --- CLI Setup ---
-def create_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="🔧 MockAPI: Contract-Based Testing & Simulation Framework",
-        epilog="""Examples:
+_DESCRIPTION = "🔧 MockAPI: Contract-Based Testing & Simulation Framework"
+
+_EPILOG = """Examples:
   mockapi validate contracts.yaml
   mockapi serve ./contracts --chaos-seed 42
   mockapi diff v1.yaml v2.yaml --format json
   mockapi report-compare v1.json v2.json --summary-only
 
 Docs: https://github.com/your-org/mockapi
-Contact: dev-team@example.com""",
+Contact: dev-team@example.com"""
+
+
+def _usage() -> str:
+    """Top-level help text, rendered without building (or importing) argparse."""
+    width = max(len(name) for name in COMMANDS) + 2
+    commands = "\n".join(f"    {name.ljust(width)}{spec['help']}" for name, spec in COMMANDS.items())
+    return (
+        "usage: mockapi [-h] [-V] {validate, serve, diff, ...} ...\n\n"
+        f"{_DESCRIPTION}\n\n"
+        "options:\n"
+        "  -h, --help     show this help message and exit\n"
+        "  -V, --version  show program's version number and exit\n\n"
+        f"Available Commands:\n{commands}\n\n"
+        f"{_EPILOG}"
+    )
+
+
+def _add_subparser(subparsers, name: str) -> None:
+    spec = COMMANDS[name]
+    command_parser = subparsers.add_parser(name, help=spec["help"])
+    for flag, options in spec["args"]:
+        command_parser.add_argument(flag, **options)
+    command_parser.set_defaults(func=dispatch)
+
+
+def _sniff_subcommand(argv) -> str:
+    """Return the requested subcommand if it is known, otherwise None."""
+    if argv and argv[0] in COMMANDS:
+        return argv[0]
+    return None
+
+
+def _convert(options: dict, raw: str):
+    value = options.get("type", str)(raw)
+    if "choices" in options and value not in options["choices"]:
+        raise ValueError(raw)
+    return value
+
+
+def _fast_parse(name: str, argv):
+    """
+    Parse a single command's arguments straight from its COMMANDS spec.
+
+    Covers the shapes the table uses (positionals, typed options, store_true
+    flags, nargs="*"). Anything else -- help, ``--opt=value``, abbreviations,
+    unknown flags, bad values, missing arguments -- returns None so argparse
+    can handle it and report errors the usual way.
+    """
+    positionals = []
+    options = {}
+    values = {"command": name, "func": dispatch}
+    for flag, spec in COMMANDS[name]["args"]:
+        if flag.startswith("-"):
+            dest = spec.get("dest", flag.lstrip("-").replace("-", "_"))
+            options[flag] = (dest, spec)
+            values[dest] = spec.get("default", False if spec.get("action") == "store_true" else None)
+        else:
+            positionals.append((flag, spec))
+
+    required = {dest for dest, spec in options.values() if spec.get("required")}
+    pending = iter(positionals)
+    i = 0
+    try:
+        while i < len(argv):
+            token = argv[i]
+            i += 1
+            if not token.startswith("-"):
+                positional = next(pending, None)
+                if positional is None:
+                    return None
+                values[positional[0]] = _convert(positional[1], token)
+                continue
+
+            if token not in options:
+                return None
+            dest, spec = options[token]
+            required.discard(dest)
+            if spec.get("action") == "store_true":
+                values[dest] = True
+            elif spec.get("nargs") == "*":
+                start = i
+                while i < len(argv) and not argv[i].startswith("-"):
+                    i += 1
+                values[dest] = [_convert(spec, raw) for raw in argv[start:i]]
+            elif set(spec) - {"type", "default", "dest", "required", "choices", "help"}:
+                return None
+            elif i < len(argv) and not argv[i].startswith("-"):
+                values[dest] = _convert(spec, argv[i])
+                i += 1
+            else:
+                return None
+    except ValueError:
+        return None
+
+    if required or next(pending, None) is not None:
+        return None
+    return SimpleNamespace(**values)
+
+
+def create_parser(command: str = None) -> "argparse.ArgumentParser":
+    """
+    Build the CLI parser.
+
+    When ``command`` names a known subcommand only that subparser is
+    registered; otherwise (top-level help, unknown commands) all are.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawTextHelpFormatter
     )
+    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
 
     subparsers = parser.add_subparsers(
         dest="command",
@@ -97,104 +302,39 @@ Contact: dev-team@example.com""",
         metavar="{validate, serve, diff, ...}"
     )
 
-    # validate
-    validate_parser = subparsers.add_parser("validate", help="Validate contract files")
-    validate_parser.add_argument("path", type=str, help="Path to contract file or directory")
-    validate_parser.set_defaults(func=handle_validate_command)
-
-    # serve
-    serve_parser = subparsers.add_parser("serve", help="Start the mock API server with chaos/test support")
-    serve_parser.add_argument("contract_path", type=str)
-    serve_parser.add_argument("--host", type=str, default="127.0.0.1")
-    serve_parser.add_argument("--port", type=int, default=8080)
-    serve_parser.add_argument("--reload", action="store_true")
-    serve_parser.add_argument("--strict-validation", action="store_true")
-    serve_parser.add_argument("--chaos-seed", type=int)
-    serve_parser.add_argument("--force-delay", nargs='*')
-    serve_parser.add_argument("--force-error", nargs='*')
-    serve_parser.set_defaults(func=handle_serve_command)
-
-    # check-compatibility
-    compat_parser = subparsers.add_parser("check-compatibility", help="Compare old/new contracts for breaking changes")
-    compat_parser.add_argument("--from", dest="from_file", required=True)
-    compat_parser.add_argument("--to", dest="to_file", required=True)
-    compat_parser.add_argument("--include-non-breaking", action="store_true")
-    compat_parser.add_argument("--severity", default="HIGH", choices=["HIGH", "MEDIUM", "LOW", "INFO"])
-    compat_parser.add_argument("--json-output", action="store_true")
-    compat_parser.add_argument("--quiet", action="store_true")
-    compat_parser.set_defaults(func=handle_check_compatibility)
-
-    # export-json
-    export_parser = subparsers.add_parser("export-json", help="Output a structured diff as JSON")
-    export_parser.add_argument("--from", dest="from_file", required=True)
-    export_parser.add_argument("--to", dest="to_file", required=True)
-    export_parser.add_argument("--output", required=True)
-    export_parser.set_defaults(func=handle_export_diff_as_json)
-
-    # validate-enhanced
-    enhanced_parser = subparsers.add_parser("validate-enhanced", help="Run strict validation using schema + filters")
-    enhanced_parser.add_argument("path", type=str)
-    enhanced_parser.set_defaults(func=handle_enhanced_validator)
-
-    # diff
-    diff_parser = subparsers.add_parser("diff", help="Summarize contract drift between versions")
-    diff_parser.add_argument("base", help="Base contract YAML file")
-    diff_parser.add_argument("target", help="Target contract YAML file")
-    diff_parser.add_argument("--format", choices=["table", "json"], default="table")
-    diff_parser.add_argument("--check-deprecated", action="store_true")
-    diff_parser.add_argument("--deprecation-report", action="store_true")
-    diff_parser.add_argument("--import-usage-data")
-    diff_parser.add_argument("--deprecation-exit-code", action="store_true")
-    diff_parser.set_defaults(func=handle_diff_command)
-
-    # report-compare
-    compare_parser = subparsers.add_parser("report-compare", help="Compare historical report files (HTML, JSON, Markdown)")
-    compare_parser.add_argument("base_report")
-    compare_parser.add_argument("current_report")
-    compare_parser.add_argument("--format", choices=["html", "markdown", "json", "terminal"], default="terminal")
-    compare_parser.add_argument("--output")
-    compare_parser.add_argument("--focus", nargs='*', choices=["coverage", "chaos", "contract", "performance"])
-    compare_parser.add_argument("--threshold", type=float, default=5.0)
-    compare_parser.add_argument("--include-improved", action="store_true", default=True)
-    compare_parser.add_argument("--summary-only", action="store_true")
-    compare_parser.set_defaults(func=handle_report_compare)
-
-    # JS-only commands
-    replay_parser = subparsers.add_parser("replay", help="Replay a session against a contract (JS-only)")
-    replay_parser.add_argument("session_file", type=str)
-    replay_parser.add_argument("--contract", required=True)
-    replay_parser.add_argument("--strict", action="store_true")
-    replay_parser.set_defaults(func=handle_replay_session)
-
-    tag_parser = subparsers.add_parser("tag-session", help="Add metadata tags to a session (JS-only)")
-    tag_parser.add_argument("session_file", type=str)
-    tag_parser.add_argument("--tags", required=True)
-    tag_parser.set_defaults(func=handle_tag_session)
-
-    filter_parser = subparsers.add_parser("filter-replay", help="Replay sessions with filtering (JS-only)")
-    filter_parser.add_argument("session_file", type=str)
-    filter_parser.add_argument("--method")
-    filter_parser.add_argument("--route")
-    filter_parser.set_defaults(func=handle_filter_replay)
-
-    test_parser = subparsers.add_parser("test-diff-scenarios", help="Run or generate test scenarios for diffing")
-    test_parser.add_argument("--create", action="store_true")
-    test_parser.set_defaults(func=handle_test_diff_scenarios)
+    for name in ([command] if command in COMMANDS else COMMANDS):
+        _add_subparser(subparsers, name)
 
     return parser
 
 
 def main():
-    parser = create_parser()
-    args = parser.parse_args()
-
-    if not hasattr(args, "func"):
-        parser.print_help()
-        exit(1)
+    argv = sys.argv[1:]
+    # Help/version/no-arg exit before argparse or any handler module is loaded
+    if not argv or argv[0] in ("-h", "--help"):
+        print(_usage())
+        exit(0 if argv else 1)
+    if argv[0] in ("-V", "--version"):
+        print(f"mockapi {__version__}")
+        exit(0)
+
+    # Patch sys.path for local imports
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+
+    command = _sniff_subcommand(argv)
+    args = _fast_parse(command, argv[1:]) if command else None
+    if args is None:
+        parser = create_parser(command)
+        args = parser.parse_args()
+
+        if not hasattr(args, "func"):
+            parser.print_help()
+            exit(1)
 
     exit_code = args.func(args)
     exit(exit_code)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
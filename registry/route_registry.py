@@ -1,6 +1,6 @@
 # registry/route_registry.py
 
-from typing import Optional
+from typing import Dict, Optional
 from contract.contract_entry import ContractEntry
 
 
@@ -12,12 +12,18 @@ class RouteMatch:
 class RouteRegistry:
     def __init__(self):
         self.routes = []
+        # METHOD -> path -> prebuilt RouteMatch; routes are literal paths
+        self._index: Dict[str, Dict[str, RouteMatch]] = {}
 
     def register(self, contract: ContractEntry, use_trie: bool = False):
         """
         Registers a contract route into the registry.
+
+        The first contract registered for a method/path pair wins.
         """
         self.routes.append(contract)
+        by_path = self._index.setdefault(contract.method.upper(), {})
+        by_path.setdefault(contract.path, RouteMatch(contract))
 
     def match(self, method: str, path: str) -> Optional[RouteMatch]:
         """
@@ -26,7 +32,5 @@ class RouteRegistry:
         Returns:
             RouteMatch if found, None otherwise.
         """
-        for contract in self.routes:
-            if contract.method.upper() == method.upper() and contract.path == path:
-                return RouteMatch(contract)
-        return None
+        by_path = self._index.get(method.upper())
+        return by_path.get(path) if by_path is not None else None
@@ -1,8 +1,41 @@
-import yaml
+import os
 import datetime
+import functools
+from collections import ChainMap
 from typing import Any, Dict, Optional, List
 
 
+@functools.lru_cache(maxsize=32)
+def _load_layout(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a layout file; the mtime in the key makes edits miss the cache.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    # PyYAML is only needed for layout-driven generation
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=Loader)
+
+
+class _LazySection:
+    """Defers rendering a section until the layout template actually outputs it."""
+    __slots__ = ('_render', '_value')
+
+    def __init__(self, render):
+        self._render = render
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = self._render()
+        return self._value
+
+
 class CustomizableReportGenerator:
     def __init__(self, data_provider: Any, template_registry: Any, user_template_dirs: Optional[List[str]] = None):
         """
@@ -13,6 +46,10 @@ class CustomizableReportGenerator:
         self.data_provider = data_provider
         self.template_registry = template_registry
         self.user_template_dirs = user_template_dirs or []
+        # Skip Jinja's per-lookup loader checks for custom section templates
+        self._get_template = functools.lru_cache(maxsize=128)(self.template_registry.jinja_env.get_template)
+        # data_version() token -> base context
+        self._ctx_cache: Dict[Any, Dict[str, Any]] = {}
 
     def generate_from_layout(self, layout_file: str, output_format: str = 'html') -> str:
         """
@@ -21,16 +58,16 @@ class CustomizableReportGenerator:
         :param output_format: 'html', 'markdown', etc.
         :return: Rendered report string
         """
-        with open(layout_file, 'r', encoding='utf-8') as f:
-            layout = yaml.safe_load(f)
+        layout_file = os.path.abspath(layout_file)
+        layout = _load_layout(layout_file, os.stat(layout_file).st_mtime_ns)
 
         context = self._prepare_base_context()
 
-        # Render all individual sections
-        sections_html = []
-        for section_def in layout.get('sections', []):
-            section_html = self._render_section(section_def, context)
-            sections_html.append(section_html)
+        # Sections render lazily, so ones the layout never outputs cost nothing
+        sections_html = [
+            _LazySection(lambda sd=section_def: self._render_section(sd, context))
+            for section_def in layout.get('sections', [])
+        ]
 
         # Render the full layout
         layout_template_name = f"{output_format}_layout"
@@ -49,14 +86,25 @@ class CustomizableReportGenerator:
     def _prepare_base_context(self) -> Dict[str, Any]:
         """
         Load and return all shared metrics and data blocks from the data provider.
+
+        Providers exposing data_version() get the context reused for as long
+        as the version is unchanged; without it, data is reloaded every call.
         """
-        return {
+        data_version = getattr(self.data_provider, "data_version", None)
+        version = data_version() if data_version is not None else None
+        if version is not None and version in self._ctx_cache:
+            return self._ctx_cache[version]
+
+        context = {
             "coverage_data": self.data_provider.get_coverage_data(),
             "chaos_data": self.data_provider.get_chaos_data(),
             "contract_data": self.data_provider.get_contract_data(),
             "performance_data": self.data_provider.get_performance_data(),
             # Extendable for more data sources
         }
+        if version is not None:
+            self._ctx_cache = {version: context}
+        return context
 
     def _render_section(self, section_def: Dict[str, Any], context: Dict[str, Any]) -> str:
         """
@@ -67,12 +115,11 @@ class CustomizableReportGenerator:
             template_path = section_def.get("template")
             if not template_path:
                 raise ValueError("Custom section requires a 'template' path.")
-            section_context = {**context, **section_def.get("context_variables", {})}
-            return self.template_registry.jinja_env.get_template(template_path).render(**section_context)
+            section_context = ChainMap(section_def.get("context_variables") or {}, context)
+            return self._get_template(template_path).render(section_context)
         else:
-            section_context = {
-                **context,
-                "title": section_def.get("title", ""),
-                "config": section_def,
-            }
+            section_context = ChainMap(
+                {"title": section_def.get("title", ""), "config": section_def},
+                context,
+            )
             return self.template_registry.render_template(section_type, section_context)
@@ -1,6 +1,15 @@
+import csv
+import io
 from report_section import ReportSection
 from typing import Dict, List
 
+# Row labels shared by every renderer
+_STATUS_TESTED = "✅ Tested"
+_STATUS_UNTESTED = "⛔ Untested"
+_CSV_STATUS_TESTED = "Tested"
+_CSV_STATUS_UNTESTED = "Untested"
+_PARTIAL = "Partial"
+_NONE = "None"
 
 class EndpointCoverageSection(ReportSection):
     def __init__(self, coverage_data: Dict):
@@ -9,75 +18,81 @@ class EndpointCoverageSection(ReportSection):
             description="Analysis of contract-defined endpoints vs. actual usage",
             data=coverage_data
         )
-        self.untested_endpoints = [
-            path for path, data in coverage_data.items() if not data["is_exercised"]
-        ]
-        self.partially_tested = [
-            path for path, data in coverage_data.items()
-            if data["is_exercised"] and data["overall_coverage"] < 100
-        ]
+        self.untested_endpoints = []
+        self.partially_tested = []
 
-    def to_markdown(self) -> str:
-        md = f"## {self.title}\n\n{self.description}\n\n"
+        # One pass classifies endpoints and builds the per-endpoint aggregates
+        # shared by every renderer:
+        # (path, is_exercised, tested_methods, overall_coverage, total_calls)
+        self._rows = []
+        for path, data in coverage_data.items():
+            exercised = data["is_exercised"]
+            coverage = data["overall_coverage"]
+            if not exercised:
+                self.untested_endpoints.append(path)
+            elif coverage < 100:
+                self.partially_tested.append(path)
+
+            methods = data["methods"]
+            tested_methods = ", ".join(
+                [m for m, info in methods.items() if info["is_tested"]]
+            ) or (_PARTIAL if exercised else _NONE)
+            total_calls = sum(m["call_count"] for m in methods.values())
+            self._rows.append((path, exercised, tested_methods, coverage, total_calls))
+        # Paths are unique, so this orders rows by path alone
+        self._rows.sort()
 
-        total = len(self.data)
-        tested = total - len(self.untested_endpoints)
-        coverage_pct = (tested / total * 100) if total > 0 else 0
+        self._total = len(coverage_data)
+        self._tested = self._total - len(self.untested_endpoints)
+        self._coverage_pct = (self._tested / self._total * 100) if self._total > 0 else 0
+        self._sorted_untested = sorted(self.untested_endpoints)
 
-        md += f"**Overall Coverage: {coverage_pct:.1f}%** ({tested}/{total} endpoints exercised)\n\n"
+    def to_markdown(self) -> str:
+        parts = [f"## {self.title}\n\n{self.description}\n\n"]
+
+        parts.append(f"**Overall Coverage: {self._coverage_pct:.1f}%** ({self._tested}/{self._total} endpoints exercised)\n\n")
 
         if self.untested_endpoints:
-            md += "### ⚠️ Untested Endpoints\n\n"
-            md += "The following endpoints defined in the contract were never called during testing:\n\n"
-            for path in sorted(self.untested_endpoints):
-                md += f"- `{path}`\n"
-            md += "\n"
-
-        md += "### Endpoint Coverage Details\n\n"
-        md += "| Endpoint | Status | Methods Tested | Coverage % | Call Count |\n"
-        md += "|----------|--------|----------------|------------|------------|\n"
-
-        for path, data in sorted(self.data.items()):
-            status = "✅ Tested" if data["is_exercised"] else "⛔ Untested"
-            tested_methods = ", ".join(
-                [m for m in data["methods"].keys() if data["methods"][m]["is_tested"]]
-            ) or ("Partial" if data["is_exercised"] else "None")
-            total_calls = sum(m["call_count"] for m in data["methods"].values())
-            md += f"| `{path}` | {status} | {tested_methods} | {data['overall_coverage']:.1f}% | {total_calls} |\n"
+            parts.append("### ⚠️ Untested Endpoints\n\n")
+            parts.append("The following endpoints defined in the contract were never called during testing:\n\n")
+            for path in self._sorted_untested:
+                parts.append(f"- `{path}`\n")
+            parts.append("\n")
 
-        return md
+        parts.append("### Endpoint Coverage Details\n\n")
+        parts.append("| Endpoint | Status | Methods Tested | Coverage % | Call Count |\n")
+        parts.append("|----------|--------|----------------|------------|------------|\n")
+
+        for path, exercised, tested_methods, coverage, total_calls in self._rows:
+            status = _STATUS_TESTED if exercised else _STATUS_UNTESTED
+            parts.append(f"| `{path}` | {status} | {tested_methods} | {coverage:.1f}% | {total_calls} |\n")
+
+        return "".join(parts)
 
     def to_html(self) -> str:
-        html = f"<section class='coverage-section'><h2>{self.title}</h2><p>{self.description}</p>"
-        total = len(self.data)
-        tested = total - len(self.untested_endpoints)
-        coverage_pct = (tested / total * 100) if total > 0 else 0
-        html += f"<p><strong>Overall Coverage:</strong> {coverage_pct:.1f}% ({tested}/{total} endpoints exercised)</p>"
+        parts = [f"<section class='coverage-section'><h2>{self.title}</h2><p>{self.description}</p>"]
+        parts.append(f"<p><strong>Overall Coverage:</strong> {self._coverage_pct:.1f}% ({self._tested}/{self._total} endpoints exercised)</p>")
 
         if self.untested_endpoints:
-            html += "<h3>⚠️ Untested Endpoints</h3><ul>"
-            for path in sorted(self.untested_endpoints):
-                html += f"<li><code>{path}</code></li>"
-            html += "</ul>"
-
-        html += "<h3>Endpoint Coverage Details</h3><table><thead><tr><th>Endpoint</th><th>Status</th><th>Methods Tested</th><th>Coverage %</th><th>Call Count</th></tr></thead><tbody>"
-        for path, data in sorted(self.data.items()):
-            status = "✅ Tested" if data["is_exercised"] else "⛔ Untested"
-            tested_methods = ", ".join(
-                [m for m in data["methods"].keys() if data["methods"][m]["is_tested"]]
-            ) or ("Partial" if data["is_exercised"] else "None")
-            total_calls = sum(m["call_count"] for m in data["methods"].values())
-            html += f"<tr><td><code>{path}</code></td><td>{status}</td><td>{tested_methods}</td><td>{data['overall_coverage']:.1f}%</td><td>{total_calls}</td></tr>"
-        html += "</tbody></table></section>"
-        return html
+            parts.append("<h3>⚠️ Untested Endpoints</h3><ul>")
+            for path in self._sorted_untested:
+                parts.append(f"<li><code>{path}</code></li>")
+            parts.append("</ul>")
+
+        parts.append("<h3>Endpoint Coverage Details</h3><table><thead><tr><th>Endpoint</th><th>Status</th><th>Methods Tested</th><th>Coverage %</th><th>Call Count</th></tr></thead><tbody>")
+        for path, exercised, tested_methods, coverage, total_calls in self._rows:
+            status = _STATUS_TESTED if exercised else _STATUS_UNTESTED
+            parts.append(f"<tr><td><code>{path}</code></td><td>{status}</td><td>{tested_methods}</td><td>{coverage:.1f}%</td><td>{total_calls}</td></tr>")
+        parts.append("</tbody></table></section>")
+        return "".join(parts)
 
     def to_json(self) -> Dict:
         return {
             "title": self.title,
             "description": self.description,
             "summary": {
-                "total": len(self.data),
-                "tested": len(self.data) - len(self.untested_endpoints),
+                "total": self._total,
+                "tested": self._tested,
                 "untested": self.untested_endpoints,
                 "partial": self.partially_tested,
             },
@@ -85,12 +100,11 @@ class EndpointCoverageSection(ReportSection):
         }
 
     def to_csv(self) -> str:
-        csv = "Endpoint,Status,Methods Tested,Coverage %,Call Count\n"
-        for path, data in sorted(self.data.items()):
-            status = "Tested" if data["is_exercised"] else "Untested"
-            tested_methods = ", ".join(
-                [m for m in data["methods"].keys() if data["methods"][m]["is_tested"]]
-            ) or ("Partial" if data["is_exercised"] else "None")
-            total_calls = sum(m["call_count"] for m in data["methods"].values())
-            csv += f"{path},{status},{tested_methods},{data['overall_coverage']:.1f},{total_calls}\n"
-        return csv
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["Endpoint", "Status", "Methods Tested", "Coverage %", "Call Count"])
+        writer.writerows(
+            (path, _CSV_STATUS_TESTED if exercised else _CSV_STATUS_UNTESTED, tested_methods, f"{coverage:.1f}", total_calls)
+            for path, exercised, tested_methods, coverage, total_calls in self._rows
+        )
+        return buf.getvalue()
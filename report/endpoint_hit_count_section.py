@@ -1,3 +1,5 @@
+import csv
+import io
 from report_section import ReportSection
 from typing import List, Dict
 
@@ -10,29 +12,38 @@ class EndpointHitCountSection(ReportSection):
         )
 
     def _process_endpoint_data(self, raw_data: List[Dict]) -> List[Dict]:
-        # Placeholder logic: sort by hit count descending
+        """
+        Sort rows by hit count, descending. The result is stored as self.data,
+        so every renderer reuses this single sort.
+        """
         return sorted(raw_data, key=lambda x: x.get("hits", 0), reverse=True)
 
     def to_markdown(self) -> str:
-        md = f"## {self.title}\n\n{self.description}\n\n"
-        md += "| Endpoint | Hits | Success % | Avg Time (ms) |\n"
-        md += "|----------|------|-----------|----------------|\n"
+        parts = [
+            f"## {self.title}\n\n{self.description}\n\n",
+            "| Endpoint | Hits | Success % | Avg Time (ms) |\n",
+            "|----------|------|-----------|----------------|\n",
+        ]
         for row in self.data:
-            md += f"| {row['endpoint']} | {row['hits']} | {row['success_rate']:.1f}% | {row['avg_time_ms']:.2f} |\n"
-        return md
+            parts.append(f"| {row['endpoint']} | {row['hits']} | {row['success_rate']:.1f}% | {row['avg_time_ms']:.2f} |\n")
+        return "".join(parts)
 
     def to_json(self) -> Dict:
         return {"title": self.title, "description": self.description, "data": self.data}
 
     def to_html(self) -> str:
-        html = f"<section><h2>{self.title}</h2><p>{self.description}</p><table><tr><th>Endpoint</th><th>Hits</th><th>Success %</th><th>Avg Time (ms)</th></tr>"
+        parts = [f"<section><h2>{self.title}</h2><p>{self.description}</p><table><tr><th>Endpoint</th><th>Hits</th><th>Success %</th><th>Avg Time (ms)</th></tr>"]
         for row in self.data:
-            html += f"<tr><td>{row['endpoint']}</td><td>{row['hits']}</td><td>{row['success_rate']:.1f}%</td><td>{row['avg_time_ms']:.2f}</td></tr>"
-        html += "</table></section>"
-        return html
+            parts.append(f"<tr><td>{row['endpoint']}</td><td>{row['hits']}</td><td>{row['success_rate']:.1f}%</td><td>{row['avg_time_ms']:.2f}</td></tr>")
+        parts.append("</table></section>")
+        return "".join(parts)
 
     def to_csv(self) -> str:
-        csv = "Endpoint,Hits,Success %,Avg Time (ms)\n"
-        for row in self.data:
-            csv += f"{row['endpoint']},{row['hits']},{row['success_rate']:.1f},{row['avg_time_ms']:.2f}\n"
-        return csv
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["Endpoint", "Hits", "Success %", "Avg Time (ms)"])
+        writer.writerows(
+            (row['endpoint'], row['hits'], f"{row['success_rate']:.1f}", f"{row['avg_time_ms']:.2f}")
+            for row in self.data
+        )
+        return buf.getvalue()
@@ -1,23 +1,4 @@
-class HtmlReportGenerator:
-    def __init__(self, report_data):
-        """
-        Initialize the HTML report generator.
-        :param report_data: A dict with pre-rendered HTML or raw data for each report section.
-        """
-        self.report_data = report_data
-
-    def generate(self) -> str:
-        html = self._create_html_skeleton()
-        html = self._add_header_section(html)
-        html = self._add_coverage_section(html)
-        html = self._add_chaos_visualizations(html)
-        html = self._add_timeline_section(html)
-        html = self._add_detail_tables(html)
-        html += "</body></html>"
-        return html
-
-    def _create_html_skeleton(self) -> str:
-        return """<!DOCTYPE html>
+_HTML_SKELETON = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -36,21 +17,42 @@ class HtmlReportGenerator:
 <h1>Mock API Usage Report</h1>
 """
 
-    def _add_header_section(self, html: str) -> str:
-        return html + "<p><strong>Generated Report:</strong> Detailed API usage summary with drift and chaos insights.</p>"
 
-    def _add_coverage_section(self, html: str) -> str:
+class HtmlReportGenerator:
+    def __init__(self, report_data):
+        """
+        Initialize the HTML report generator.
+        :param report_data: A dict with pre-rendered HTML or raw data for each report section.
+        """
+        self.report_data = report_data
+
+    def generate(self) -> str:
+        parts = [
+            _HTML_SKELETON,
+            self._header_fragment(),
+            self._coverage_fragment(),
+            self._chaos_fragment(),
+            self._timeline_fragment(),
+            self._details_fragment(),
+            "</body></html>",
+        ]
+        return "".join(parts)
+
+    def _header_fragment(self) -> str:
+        return "<p><strong>Generated Report:</strong> Detailed API usage summary with drift and chaos insights.</p>"
+
+    def _coverage_fragment(self) -> str:
         coverage_html = self.report_data.get("coverage_section", "")
-        return html + f"<div class='section' id='coverage'>{coverage_html}</div>"
+        return f"<div class='section' id='coverage'>{coverage_html}</div>"
 
-    def _add_chaos_visualizations(self, html: str) -> str:
+    def _chaos_fragment(self) -> str:
         chaos_html = self.report_data.get("chaos_section", "")
-        return html + f"<div class='section' id='chaos'>{chaos_html}</div>"
+        return f"<div class='section' id='chaos'>{chaos_html}</div>"
 
-    def _add_timeline_section(self, html: str) -> str:
+    def _timeline_fragment(self) -> str:
         timeline_html = self.report_data.get("timeline_section", "")
-        return html + f"<div class='section' id='timeline'>{timeline_html}</div>"
+        return f"<div class='section' id='timeline'>{timeline_html}</div>"
 
-    def _add_detail_tables(self, html: str) -> str:
+    def _details_fragment(self) -> str:
         details_html = self.report_data.get("details_section", "")
-        return html + f"<div class='section' id='details'>{details_html}</div>"
+        return f"<div class='section' id='details'>{details_html}</div>"
@@ -1,5 +1,20 @@
-import json
-from typing import Callable, Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, Tuple, Union
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested dicts/lists into hashable tuples usable as a cache key.
+
+    Containers are tagged with their kind, so {"a": 1} and [("a", 1)] get
+    different keys.
+    """
+    if isinstance(value, dict):
+        return ("d", tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return ("l", tuple(_freeze(v) for v in value))
+    if isinstance(value, set):
+        return ("s", frozenset(_freeze(v) for v in value))
+    return value
 
 
 class LazyReportGenerator:
@@ -10,7 +25,7 @@ class LazyReportGenerator:
         :param data_source: Object exposing necessary methods or metrics for section generation.
         """
         self.data_source = data_source
-        self.generated_sections: Dict[str, str] = {}
+        self.generated_sections: Dict[Union[str, Tuple], str] = {}
 
     def get_section(self, section_name: str, options: Optional[Dict] = None) -> str:
         """
@@ -53,11 +68,10 @@ class LazyReportGenerator:
         }
         return generators.get(section_name)
 
-    def _create_cache_key(self, section_name: str, options: Optional[Dict]) -> str:
+    def _create_cache_key(self, section_name: str, options: Optional[Dict]) -> Union[str, Tuple]:
         """
-        Create a unique cache key based on section name and serialized options.
+        Create a unique cache key based on section name and frozen options.
         """
         if not options:
             return section_name
-        options_str = json.dumps(options, sort_keys=True)
-        return f"{section_name}:{options_str}"
+        return (section_name, _freeze(options))
@@ -1,20 +1,103 @@
 import re
+import bisect
 import logging
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple, Any, Union
-from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple, Any, Union
+from collections import Counter, defaultdict, OrderedDict
 
 from contract.contract_entry import ContractEntry, HttpMethod
 
 logger = logging.getLogger(__name__)
 
+_PATH_PARAM_RE = re.compile(r"{([^{}]+)}")
+# Literal route text is compiled unescaped, so these can change what it matches
+_REGEX_META_RE = re.compile(r"[.^$*+?()\[\]{}|\\]")
+
+# Verb -> HttpMethod; HttpMethod is a str enum, so members look themselves up too
+_METHOD_MAP: Dict[str, HttpMethod] = {m.value: m for m in HttpMethod}
+
+# Shared, read-only path_params for routes without parameters
+_EMPTY_PARAMS: Mapping[str, str] = MappingProxyType({})
+
+# Bound on memoized match() results; hot paths stay resident, one-offs age out
+_MATCH_CACHE_MAX = 2048
+
+
+@dataclass(frozen=True)
+class PathPlan:
+    """Pre-parsed view of a contract path: literal prefix plus typed segments."""
+    static_prefix: str
+    segments: Tuple[Tuple[str, str], ...]  # ("lit", text) or ("param", name), one per "/"
+    param_count: int
+    has_wildcard: bool
+    # Segments once the outer slashes are stripped; what specificity scoring counts
+    segment_count: int
+    # Every segment is literal or a whole "{param}", so the trie can hold the
+    # route; wildcards and parameters embedded in a segment need the regex
+    trie_compatible: bool
+
+
+def _compile_path(path: str) -> PathPlan:
+    segments = []
+    trie_compatible = path.startswith("/") and "*" not in path
+    for segment in path[1:].split("/") if path.startswith("/") else path.split("/"):
+        param = _PATH_PARAM_RE.fullmatch(segment)
+        if param:
+            segments.append(("param", param.group(1)))
+        else:
+            if "{" in segment or "}" in segment:
+                trie_compatible = False
+            segments.append(("lit", segment))
+
+    param_start = path.find("{")
+    wildcard_start = path.find("*")
+    cut = min(i for i in (param_start, wildcard_start, len(path)) if i >= 0)
+
+    return PathPlan(
+        static_prefix=path[:cut],
+        segments=tuple(segments),
+        param_count=len(_PATH_PARAM_RE.findall(path)),
+        has_wildcard="*" in path,
+        segment_count=len(path.strip("/").split("/")),
+        trie_compatible=trie_compatible,
+    )
+
+
+@dataclass
+class _RouteRecord:
+    """A registered route with everything matching needs, computed once at register time."""
+    contract: ContractEntry
+    order: int                          # index among the method's routes; breaks score ties
+    category: str                       # "static", "parameterized" or "wildcard"
+    score: int
+    pattern: Optional[re.Pattern] = None  # only for routes the trie can't hold
+    static_prefix: str = ""
+    param_names: Tuple[str, ...] = ()
+    # How many "/" a matching request path can contain (max None: unbounded)
+    min_slashes: int = 0
+    max_slashes: Optional[int] = None
+
+    @property
+    def rank(self) -> Tuple[int, int]:
+        """Sort key: most specific first, ties to the earliest registered."""
+        return -self.score, self.order
+
+
+@dataclass
+class _TrieNode:
+    """One path segment in the trie of parameterized routes, shared by all methods."""
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    param_child: Optional["_TrieNode"] = None
+    leaves: Dict[HttpMethod, List[_RouteRecord]] = field(default_factory=dict)
+
 
 @dataclass
 class RouteMatch:
     """Represents a matched route with extracted parameters"""
     contract: ContractEntry
-    path_params: Dict[str, str] = field(default_factory=dict)
-    query_params: Dict[str, str] = field(default_factory=dict)
+    path_params: Mapping[str, str] = field(default_factory=lambda: _EMPTY_PARAMS)
+    query_params: Optional[Dict[str, str]] = None  # not set by the registry
     match_type: str = "exact"  # "exact", "wildcard", or "parameterized"
     match_score: int = 100     # Higher is better/more specific match
 
@@ -23,39 +106,65 @@ class RouteRegistry:
     """Registers and matches API routes with support for parameterized and wildcard paths."""
 
     def __init__(self):
-        self._routes_by_method: Dict[HttpMethod, List[ContractEntry]] = defaultdict(list)
+        self._routes_by_method: Dict[HttpMethod, List[_RouteRecord]] = defaultdict(list)
+        # method -> path -> every route registered with exactly that path
+        self._exact: Dict[HttpMethod, Dict[str, List[_RouteRecord]]] = defaultdict(dict)
         self._pattern_cache: Dict[str, re.Pattern] = {}
-
-        self._total_routes = 0
-        self._static_routes = 0
-        self._parameterized_routes = 0
-        self._wildcard_routes = 0
+        self._path_plans: Dict[str, PathPlan] = {}
+        # Parameterized routes resolve through one segment trie (methods share
+        # path nodes and split only at the leaves); wildcard and
+        # mid-segment-parameter routes keep their regex. Static routes only
+        # ever match by exact path, so they need neither.
+        self._trie = _TrieNode()
+        self._trie_methods: Set[HttpMethod] = set()
+        # Trailing-wildcard routes ("/static/*") match by prefix, in registration order
+        self._prefix_routes: Dict[HttpMethod, List[_RouteRecord]] = defaultdict(list)
+        # Kept sorted by rank, so scans can stop at the first hit
+        self._regex_routes: Dict[HttpMethod, List[_RouteRecord]] = defaultdict(list)
+        # Ranks of _regex_routes, index for index; bisect only takes key= from 3.10
+        self._regex_ranks: Dict[HttpMethod, List[Tuple[int, int]]] = defaultdict(list)
+        # method -> (one alternation over all its regex routes, outer group -> route);
+        # built on first match and dropped whenever a route is registered
+        self._combined: Dict[HttpMethod, Tuple[re.Pattern, Dict[int, _RouteRecord]]] = {}
+        # method -> (min, max) "/" count over its regex routes; max None if unbounded
+        self._regex_slashes: Dict[HttpMethod, Tuple[int, Optional[int]]] = {}
+        # LRU of match() results, misses (None) included; cleared on register
+        self._match_cache: "OrderedDict[Tuple[HttpMethod, str], Optional[RouteMatch]]" = OrderedDict()
+        # Registered routes per category; only touched by register()
+        self._route_counts: Counter = Counter()
 
     @property
     def total_routes(self) -> int:
-        return self._total_routes
+        return sum(self._route_counts.values())
 
     def _compile_path_pattern(self, path: str) -> re.Pattern:
         if path in self._pattern_cache:
             return self._pattern_cache[path]
 
+        # Unanchored: callers use fullmatch(). Parameters are positional groups,
+        # named by the route record's param_names.
         if "*" in path:
-            pattern_str = "^" + re.escape(path).replace("\\*", ".*") + "$"
+            pattern_str = re.escape(path).replace("\\*", ".*")
         else:
-            pattern_str = re.sub(r"{([^{}]+)}", r"(?P<\1>[^/]+)", path)
-            pattern_str = "^" + pattern_str + "$"
+            pattern_str = _PATH_PARAM_RE.sub("([^/]+)", path)
 
-        compiled = re.compile(pattern_str)
+        compiled = re.compile(pattern_str, re.ASCII)
         self._pattern_cache[path] = compiled
         return compiled
 
+    def _get_path_plan(self, path: str) -> PathPlan:
+        plan = self._path_plans.get(path)
+        if plan is None:
+            plan = self._path_plans[path] = _compile_path(path)
+        return plan
+
     def _categorize_path(self, path: str) -> Tuple[str, int]:
-        if "*" in path:
+        plan = self._get_path_plan(path)
+        if plan.has_wildcard:
             return "wildcard", 10
         elif "{" in path:
-            segments = path.strip("/").split("/")
-            param_count = len(re.findall(r"{([^{}]+)}", path))
-            static_count = len(segments) - param_count
+            param_count = plan.param_count
+            static_count = plan.segment_count - param_count
             score = 50 + static_count * 10 - param_count
             return "parameterized", score
         else:
@@ -65,108 +174,313 @@ class RouteRegistry:
         path = contract.path
         method = contract.method
 
-        self._compile_path_pattern(path)
-        self._routes_by_method[method].append(contract)
+        category, score = self._categorize_path(path)
+        record = _RouteRecord(
+            contract=contract,
+            order=len(self._routes_by_method[method]),
+            category=category,
+            score=score,
+        )
+        self._routes_by_method[method].append(record)
+        self._exact[method].setdefault(path, []).append(record)
+        self._match_cache.clear()
+        self._route_counts[category] += 1
+
+        if category == "wildcard" and path.find("*") == len(path) - 1 and "{" not in path:
+            record.static_prefix = path[:-1]
+            self._prefix_routes[method].append(record)
+        elif category != "static":
+            plan = self._path_plans[path]
+            if category != "parameterized" or not plan.trie_compatible:
+                record.pattern = self._compile_path_pattern(path)
+                record.static_prefix = plan.static_prefix
+                if category == "parameterized":
+                    record.param_names = tuple(_PATH_PARAM_RE.findall(path))
+                self._set_slash_bounds(method, record)
+                ranks = self._regex_ranks[method]
+                index = bisect.bisect_right(ranks, record.rank)
+                ranks.insert(index, record.rank)
+                self._regex_routes[method].insert(index, record)
+                self._combined.pop(method, None)
+            else:
+                record.param_names = tuple(value for kind, value in plan.segments if kind == "param")
+                self._insert_trie(method, record, plan.segments)
 
-        self._total_routes += 1
-        category, _ = self._categorize_path(path)
+        logger.debug(f"Registered route: {method.value} {path} ({category})")
 
-        if category == "static":
-            self._static_routes += 1
-        elif category == "parameterized":
-            self._parameterized_routes += 1
-        elif category == "wildcard":
-            self._wildcard_routes += 1
+    def _set_slash_bounds(self, method: HttpMethod, record: _RouteRecord) -> None:
+        """
+        Bound the "/" count of paths a regex route can match. Parameters never
+        span "/", wildcards may; unescaped regex syntax in the literal text
+        (e.g. "/?") voids any bound.
+        """
+        path = record.contract.path
+        if record.category == "wildcard":
+            record.min_slashes = path.count("/")
+        elif not _REGEX_META_RE.search(_PATH_PARAM_RE.sub("", path)):
+            record.min_slashes = record.max_slashes = path.count("/")
+
+        bounds = self._regex_slashes.get(method)
+        if bounds is None:
+            self._regex_slashes[method] = (record.min_slashes, record.max_slashes)
+        else:
+            high = None if bounds[1] is None or record.max_slashes is None else max(bounds[1], record.max_slashes)
+            self._regex_slashes[method] = (min(bounds[0], record.min_slashes), high)
+
+    def _insert_trie(self, method: HttpMethod, record: _RouteRecord,
+                     segments: Tuple[Tuple[str, str], ...]) -> None:
+        node = self._trie
+        for kind, value in segments:
+            if kind == "param":
+                if node.param_child is None:
+                    node.param_child = _TrieNode()
+                node = node.param_child
+            else:
+                child = node.children.get(value)
+                if child is None:
+                    child = node.children[value] = _TrieNode()
+                node = child
+        node.leaves.setdefault(method, []).append(record)
+        self._trie_methods.add(method)
+
+    def _trie_matches(self, method: HttpMethod, path: str) -> List[Tuple[_RouteRecord, Dict[str, str]]]:
+        """Every trie route matching ``path``, with its extracted parameters."""
+        if method not in self._trie_methods or not path.startswith("/"):
+            return []
+
+        segments = path[1:].split("/")
+        depth = len(segments)
+        values: List[str] = []
+        found = []
+
+        def walk(node: _TrieNode, i: int) -> None:
+            if i == depth:
+                for record in node.leaves.get(method, ()):
+                    found.append((record, dict(zip(record.param_names, values))))
+                return
+            segment = segments[i]
+            child = node.children.get(segment)
+            if child is not None:
+                walk(child, i + 1)
+            if node.param_child is not None and segment:
+                values.append(segment)
+                walk(node.param_child, i + 1)
+                values.pop()
+
+        walk(self._trie, 0)
+        return found
+
+    def _prefix_matches(self, method: HttpMethod, path: str) -> Iterator[_RouteRecord]:
+        """Trailing-wildcard routes matching ``path``, earliest registered first."""
+        for record in self._prefix_routes.get(method, ()):
+            # Same acceptance as fullmatch on "prefix.*": "." stops at newlines
+            if path.startswith(record.static_prefix) and path.find("\n", len(record.static_prefix)) < 0:
+                yield record
+
+    def _candidates(self, method: HttpMethod, path: str) -> List[Tuple[int, RouteMatch]]:
+        """Non-exact matches for ``path`` as (index in method's routes, RouteMatch)."""
+        candidates = [
+            (record.order, RouteMatch(
+                contract=record.contract,
+                path_params=params,
+                match_type="parameterized",
+                match_score=record.score
+            ))
+            for record, params in self._trie_matches(method, path)
+        ]
+        candidates.extend(
+            (record.order, RouteMatch(contract=record.contract, match_type="wildcard", match_score=record.score))
+            for record in self._prefix_matches(method, path)
+        )
+
+        slashes = path.count("/")
+        for record in self._regex_routes.get(method, ()):
+            if slashes < record.min_slashes or (record.max_slashes is not None and slashes > record.max_slashes):
+                continue
+            if not path.startswith(record.static_prefix):
+                continue
+            match = record.pattern.fullmatch(path)
+            if match:
+                candidates.append((record.order, RouteMatch(
+                    contract=record.contract,
+                    path_params=dict(zip(record.param_names, match.groups())) if record.param_names else _EMPTY_PARAMS,
+                    match_type=record.category,
+                    match_score=record.score
+                )))
+        return candidates
+
+    def _combined_pattern(self, method: HttpMethod) -> Optional[Tuple[re.Pattern, Dict[int, _RouteRecord]]]:
+        """
+        Compile every regex route of ``method`` into a single alternation.
+
+        Alternatives follow the routes' rank order, so the first one the engine matches is the best regex route for the path.
+        Each route is wrapped in an outer group whose index identifies it via
+        ``Match.lastindex``; its parameters are the positional groups that
+        follow it.
+        """
+        combined = self._combined.get(method)
+        if combined is not None:
+            return combined
+
+        records = self._regex_routes.get(method)
+        if not records:
+            return None
 
-        logger.debug(f"Registered route: {method.value} {path} ({category})")
+        bodies = []
+        routes: Dict[int, _RouteRecord] = {}
+        group = 1
+        for record in records:
+            routes[group] = record
+            bodies.append("(" + record.pattern.pattern + ")")
+            group += 1 + record.pattern.groups
+
+        combined = self._combined[method] = (re.compile("|".join(bodies), re.ASCII), routes)
+        return combined
+
+    def _slashes_in_range(self, method: HttpMethod, path: str) -> bool:
+        low, high = self._regex_slashes[method]
+        slashes = path.count("/")
+        return slashes >= low and (high is None or slashes <= high)
+
+    def _best_regex_match(self, method: HttpMethod, path: str) -> Optional[Tuple[_RouteRecord, Mapping[str, str]]]:
+        combined = self._combined_pattern(method)
+        if combined is None:
+            return None
+        pattern, routes = combined
+        match = pattern.fullmatch(path)
+        if match is None:
+            return None
+
+        outer = match.lastindex
+        record = routes[outer]
+        params = _EMPTY_PARAMS
+        if record.param_names:
+            params = dict(zip(record.param_names, match.groups()[outer:outer + len(record.param_names)]))
+        return record, params
 
     def register_many(self, contracts: List[ContractEntry]) -> None:
         for contract in contracts:
             self.register(contract)
+        self.freeze()
 
         logger.info(f"Registered {len(contracts)} routes: "
-                    f"{self._static_routes} static, "
-                    f"{self._parameterized_routes} parameterized, "
-                    f"{self._wildcard_routes} wildcard")
+                    f"{self._route_counts['static']} static, "
+                    f"{self._route_counts['parameterized']} parameterized, "
+                    f"{self._route_counts['wildcard']} wildcard")
+
+    def freeze(self) -> None:
+        """
+        Build the lazily compiled lookup structures now, so the first request
+        for each method doesn't pay for them. Registering more routes later is
+        still allowed and simply invalidates what it affects again.
+        """
+        for method in self._regex_routes:
+            self._combined_pattern(method)
+
+    @staticmethod
+    def _normalize_method(method: Union[str, HttpMethod]) -> Optional[HttpMethod]:
+        normalized = _METHOD_MAP.get(method)
+        if normalized is None and isinstance(method, str):
+            normalized = _METHOD_MAP.get(method.upper())
+        return normalized
 
     def match(self, method: Union[str, HttpMethod], path: str) -> Optional[RouteMatch]:
-        if isinstance(method, str):
-            try:
-                method = HttpMethod(method.upper())
-            except ValueError:
+        method = self._normalize_method(method)
+        if method is None:
+            return None
+        return self._match_fast(method, path)
+
+    def _match_fast(self, method: HttpMethod, path: str) -> Optional[RouteMatch]:
+        """match() for callers that already hold an HttpMethod member."""
+        key = (method, path)
+        cache = self._match_cache
+        if key in cache:
+            cache.move_to_end(key)
+            hit = cache[key]
+            # Callers own the returned match, so hand out fresh dicts
+            if hit is None:
                 return None
-
-        routes = self._routes_by_method.get(method, [])
-        if not routes:
+            params = dict(hit.path_params) if hit.path_params else _EMPTY_PARAMS
+            return replace(hit, path_params=params)
+
+        result = self._match_uncached(method, path)
+        cache[key] = result
+        if len(cache) > _MATCH_CACHE_MAX:
+            cache.popitem(last=False)
+        if result is None:
             return None
-
-        for contract in routes:
-            if contract.path == path:
-                return RouteMatch(contract=contract, match_type="exact", match_score=100)
-
-        matches = []
-
-        for contract in routes:
-            category, score = self._categorize_path(contract.path)
-            pattern = self._pattern_cache.get(contract.path)
-
-            if not pattern:
-                continue
-
-            match = pattern.match(path)
-            if match:
-                path_params = match.groupdict() if category == "parameterized" else {}
-                matches.append(RouteMatch(
-                    contract=contract,
-                    path_params=path_params,
-                    match_type=category,
-                    match_score=score
-                ))
-
-        return max(matches, key=lambda m: m.match_score) if matches else None
+        return replace(result, path_params=dict(result.path_params) if result.path_params else _EMPTY_PARAMS)
+
+    def _match_uncached(self, method: HttpMethod, path: str) -> Optional[RouteMatch]:
+        exact = self._exact.get(method, {}).get(path)
+        if exact:
+            return RouteMatch(contract=exact[0].contract, match_type="exact", match_score=100)
+
+        # Lowest rank wins. Regex and prefix routes are consulted only if their
+        # best-ranked route could still beat what the trie found.
+        best = None
+        for record, params in self._trie_matches(method, path):
+            if best is None or record.rank < best[0].rank:
+                best = (record, params)
+
+        regex_routes = self._regex_routes.get(method)
+        if regex_routes and (best is None or regex_routes[0].rank < best[0].rank) \
+                and self._slashes_in_range(method, path):
+            hit = self._best_regex_match(method, path)
+            if hit is not None and (best is None or hit[0].rank < best[0].rank):
+                best = hit
+
+        prefix_routes = self._prefix_routes.get(method)
+        if prefix_routes and (best is None or prefix_routes[0].rank < best[0].rank):
+            record = next(self._prefix_matches(method, path), None)
+            if record is not None and (best is None or record.rank < best[0].rank):
+                best = (record, _EMPTY_PARAMS)
+
+        if best is None:
+            return None
+        record, params = best
+        return RouteMatch(
+            contract=record.contract,
+            path_params=params,
+            match_type=record.category,
+            match_score=record.score
+        )
 
     def find_all_matches(self, method: Union[str, HttpMethod], path: str) -> List[RouteMatch]:
-        if isinstance(method, str):
-            try:
-                method = HttpMethod(method.upper())
-            except ValueError:
-                return []
-
-        routes = self._routes_by_method.get(method, [])
-        matches = []
-
-        for contract in routes:
-            category, score = self._categorize_path(contract.path)
-            pattern = self._pattern_cache.get(contract.path)
-
-            if contract.path == path:
-                matches.append(RouteMatch(contract=contract, match_type="exact", match_score=100))
-                continue
-
-            if pattern and pattern.match(path):
-                path_params = pattern.match(path).groupdict() if category == "parameterized" else {}
-                matches.append(RouteMatch(
-                    contract=contract,
-                    path_params=path_params,
-                    match_type=category,
-                    match_score=score
-                ))
-
-        return sorted(matches, key=lambda m: m.match_score, reverse=True)
+        method = self._normalize_method(method)
+        if method is None:
+            return []
+
+        matches = [
+            (record.order, RouteMatch(contract=record.contract, match_type="exact", match_score=100))
+            for record in self._exact.get(method, {}).get(path, ())
+        ]
+        matches.extend(
+            candidate for candidate in self._candidates(method, path)
+            if candidate[1].contract.path != path
+        )
+
+        # Exact hits rank as score 100; the trie yields its matches unordered
+        matches.sort(key=lambda item: (-item[1].match_score, item[0]))
+        return [match for _, match in matches]
 
     def get_routes(self, method: Optional[HttpMethod] = None) -> List[ContractEntry]:
         if method:
-            return list(self._routes_by_method.get(method, []))
+            return [record.contract for record in self._routes_by_method.get(method, [])]
 
-        all_routes = []
-        for route_list in self._routes_by_method.values():
-            all_routes.extend(route_list)
-        return all_routes
+        return [record.contract for records in self._routes_by_method.values() for record in records]
 
     def clear(self) -> None:
         self._routes_by_method.clear()
+        self._exact.clear()
         self._pattern_cache.clear()
-        self._total_routes = 0
-        self._static_routes = 0
-        self._parameterized_routes = 0
-        self._wildcard_routes = 0
+        self._path_plans.clear()
+        self._trie = _TrieNode()
+        self._trie_methods.clear()
+        self._regex_routes.clear()
+        self._regex_ranks.clear()
+        self._prefix_routes.clear()
+        self._combined.clear()
+        self._regex_slashes.clear()
+        self._match_cache.clear()
+        self._route_counts.clear()
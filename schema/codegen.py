@@ -0,0 +1,240 @@
+"""
+Plain-Python validators generated from simple request body schemas.
+
+Most mocked request bodies are a handful of required fields with type
+checks. For those, ``compile_check`` writes a function that tests exactly
+what the schema asks for, so validating is a few ``isinstance`` calls
+rather than a jsonschema walk. It is the fallback for when fastjsonschema
+is not installed or cannot compile a schema.
+
+Only a subset of JSON Schema is supported; anything else (``$ref``,
+combinators, ``patternProperties``, ...) makes ``compile_check`` return
+None. A generated check only ever answers True for data jsonschema would
+accept. Where they might disagree it answers False, and callers hand the
+data to jsonschema as usual.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# Keywords jsonschema would enforce that the generator doesn't implement
+_UNSUPPORTED = frozenset({
+    "$ref", "$recursiveRef", "$dynamicRef", "allOf", "anyOf", "oneOf", "not",
+    "if", "then", "else", "dependencies", "dependentRequired", "dependentSchemas",
+    "patternProperties", "propertyNames", "minProperties", "maxProperties",
+    "additionalItems", "prefixItems", "contains", "minContains", "maxContains",
+    "uniqueItems", "unevaluatedProperties", "unevaluatedItems", "multipleOf",
+    "exclusiveMinimum", "exclusiveMaximum", "disallow", "extends", "divisibleBy",
+})
+
+# Integers are checked as int only: 1.0 counts as an integer in some drafts
+# and not others, so it is left to jsonschema
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+}
+
+_IS_NUMBER = "(isinstance({v}, (int, float)) and not isinstance({v}, bool))"
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _count(schema: Dict[str, Any], key: str) -> Optional[int]:
+    value = schema.get(key)
+    if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+        raise _Unsupported(schema)
+    return value
+
+
+class _Generator:
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._names = 0
+
+    def _name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("_c")
+        self.constants[name] = value
+        return name
+
+    def _emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def schema(self, schema: Any, v: str, indent: int) -> None:
+        if schema is True:
+            return
+        if schema is False:
+            self._emit(indent, "return False")
+            return
+        if not isinstance(schema, dict):
+            raise _Unsupported(schema)
+        if _UNSUPPORTED.intersection(schema) or "draft-03" in str(schema.get("$schema", "")):
+            raise _Unsupported(schema)
+
+        known = None
+        types = schema.get("type")
+        if types is not None:
+            if isinstance(types, str):
+                types = [types]
+            if not types or any(t not in _TYPE_CHECKS for t in types):
+                raise _Unsupported(schema)
+            checks = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+            self._emit(indent, f"if not ({checks}):")
+            self._emit(indent + 1, "return False")
+            if len(types) == 1:
+                known = types[0]
+
+        if "enum" in schema or "const" in schema:
+            self._enum(schema, v, indent)
+
+        self._object(schema, v, indent, known)
+        self._array(schema, v, indent, known)
+        self._string(schema, v, indent, known)
+        self._number(schema, v, indent, known)
+
+    def _enum(self, schema: Dict[str, Any], v: str, indent: int) -> None:
+        for key in ("enum", "const"):
+            if key not in schema:
+                continue
+            values = schema[key] if key == "enum" else [schema[key]]
+            if not isinstance(values, list):
+                raise _Unsupported(schema)
+            # Containers could compare True == 1 where jsonschema doesn't
+            if any(isinstance(value, (dict, list)) for value in values):
+                raise _Unsupported(schema)
+            # Same type and equal: stricter than jsonschema (1 vs 1.0), never looser
+            allowed = self._constant(tuple(values))
+            self._emit(indent, f"if not any(type({v}) is type(e) and {v} == e for e in {allowed}):")
+            self._emit(indent + 1, "return False")
+
+    def _guard(self, indent: int, known: Optional[str], kind: str, check: str) -> int:
+        """Open an ``if`` limiting the following checks to ``kind``, unless the type is already known."""
+        if known == kind:
+            return indent
+        self._emit(indent, f"if {check}:")
+        return indent + 1
+
+    def _object(self, schema: Dict[str, Any], v: str, indent: int, known: Optional[str]) -> None:
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        additional = schema.get("additionalProperties", True)
+        if not isinstance(properties, dict) or not isinstance(required, list):
+            raise _Unsupported(schema)
+        if not all(isinstance(name, str) for name in list(properties) + required):
+            raise _Unsupported(schema)
+        if not isinstance(additional, bool):
+            raise _Unsupported(schema)
+        checked = [(name, subschema) for name, subschema in properties.items() if subschema is not True and subschema != {}]
+        if not checked and not required and additional:
+            return
+
+        indent = self._guard(indent, known, "object", f"isinstance({v}, dict)")
+        for name in required:
+            self._emit(indent, f"if {name!r} not in {v}:")
+            self._emit(indent + 1, "return False")
+        if not additional:
+            declared = self._constant(frozenset(properties))
+            self._emit(indent, f"for k in {v}:")
+            self._emit(indent + 1, f"if k not in {declared}:")
+            self._emit(indent + 2, "return False")
+        for name, subschema in checked:
+            child = self._name("v")
+            if name in required:
+                self._emit(indent, f"{child} = {v}[{name!r}]")
+                self.schema(subschema, child, indent)
+            else:
+                self._emit(indent, f"if {name!r} in {v}:")
+                self._emit(indent + 1, f"{child} = {v}[{name!r}]")
+                self.schema(subschema, child, indent + 1)
+
+    def _array(self, schema: Dict[str, Any], v: str, indent: int, known: Optional[str]) -> None:
+        items = schema.get("items", True)
+        min_items = _count(schema, "minItems")
+        max_items = _count(schema, "maxItems")
+        if not isinstance(items, (dict, bool)):
+            raise _Unsupported(schema)  # tuple validation
+        if items == {}:
+            items = True
+        if items is True and min_items is None and max_items is None:
+            return
+
+        indent = self._guard(indent, known, "array", f"isinstance({v}, list)")
+        if min_items is not None:
+            self._emit(indent, f"if len({v}) < {min_items}:")
+            self._emit(indent + 1, "return False")
+        if max_items is not None:
+            self._emit(indent, f"if len({v}) > {max_items}:")
+            self._emit(indent + 1, "return False")
+        if items is not True:
+            item = self._name("v")
+            self._emit(indent, f"for {item} in {v}:")
+            body = len(self.lines)
+            self.schema(items, item, indent + 1)
+            if len(self.lines) == body:
+                self._emit(indent + 1, "pass")
+
+    def _string(self, schema: Dict[str, Any], v: str, indent: int, known: Optional[str]) -> None:
+        min_length = _count(schema, "minLength")
+        max_length = _count(schema, "maxLength")
+        pattern = schema.get("pattern")
+        if min_length is None and max_length is None and pattern is None:
+            return
+
+        indent = self._guard(indent, known, "string", f"isinstance({v}, str)")
+        if min_length is not None:
+            self._emit(indent, f"if len({v}) < {min_length}:")
+            self._emit(indent + 1, "return False")
+        if max_length is not None:
+            self._emit(indent, f"if len({v}) > {max_length}:")
+            self._emit(indent + 1, "return False")
+        if pattern is not None:
+            try:
+                compiled = self._constant(re.compile(pattern))
+            except re.error:
+                raise _Unsupported(schema)
+            self._emit(indent, f"if {compiled}.search({v}) is None:")
+            self._emit(indent + 1, "return False")
+
+    def _number(self, schema: Dict[str, Any], v: str, indent: int, known: Optional[str]) -> None:
+        bounds = [(key, schema[key]) for key in ("minimum", "maximum") if key in schema]
+        if not bounds:
+            return
+        if any(isinstance(bound, bool) or not isinstance(bound, (int, float)) for _, bound in bounds):
+            raise _Unsupported(schema)
+
+        if known not in ("number", "integer"):
+            self._emit(indent, f"if {_IS_NUMBER.format(v=v)}:")
+            indent += 1
+        for key, bound in bounds:
+            op = "<" if key == "minimum" else ">"
+            self._emit(indent, f"if {v} {op} {self._constant(bound)}:")
+            self._emit(indent + 1, "return False")
+
+
+def compile_check(schema: Any, name: str = "<schema>") -> Optional[Callable[[Any], bool]]:
+    """
+    A generated ``check(data) -> bool`` for ``schema``, or None if the schema
+    uses something the generator doesn't support. ``name`` labels the
+    generated code in tracebacks.
+    """
+    generator = _Generator()
+    try:
+        generator.schema(schema, "data", 1)
+    except (_Unsupported, TypeError, ValueError):
+        return None
+
+    source = "\n".join(["def check(data):"] + generator.lines + ["    return True", ""])
+    namespace = dict(generator.constants)
+    exec(compile(source, name, "exec"), namespace)
+    return namespace["check"]
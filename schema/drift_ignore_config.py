@@ -1,8 +1,11 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, FrozenSet, Tuple
 from contract.contract_drift_analyzer import ContractDriftAnalyzer
 from core.usage_data_processor import UsageDataProcessor
 from core.test_coverage_analyzer import TestCoverageAnalyzer
 
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+
+
 class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
     """
     Extended contract drift analyzer that incorporates API usage data and test coverage.
@@ -18,32 +21,87 @@ class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
         super().__init__(old_contract_path, new_contract_path)
         self.usage_data = usage_data
         self.test_coverage = test_coverage
+        # (old_contract, new_contract, route keys) for the contracts last walked
+        self._route_keys: Optional[Tuple[Any, Any, FrozenSet[str]]] = None
+
+    def _all_route_keys(self) -> FrozenSet[str]:
+        """"METHOD:path" for every operation in either contract, computed once per loaded pair."""
+        cached = self._route_keys
+        if cached is not None and cached[0] is self.old_contract and cached[1] is self.new_contract:
+            return cached[2]
+
+        keys = frozenset(
+            f"{method.upper()}:{path}"
+            for contract in (self.old_contract, self.new_contract)
+            for path, path_item in contract.get("paths", {}).items()
+            for method in path_item.keys()
+            if method in _HTTP_METHODS
+        )
+        self._route_keys = (self.old_contract, self.new_contract, keys)
+        return keys
 
     def analyze_drift(self) -> Dict[str, Any]:
         diff = super().analyze_drift()
 
+        # Classify each modified route once; both impact passes reuse it
+        breaking = self._breaking_route_keys(diff)
+
         if self.usage_data:
-            diff["usage_impact"] = self._calculate_usage_impact(diff)
+            diff["usage_impact"] = self._calculate_usage_impact(diff, breaking)
 
         if self.test_coverage:
-            diff["test_impact"] = self._analyze_test_impact(diff)
+            diff["test_impact"] = self._analyze_test_impact(diff, breaking)
 
         return diff
 
-    def _calculate_usage_impact(self, diff: Dict[str, Any]) -> Dict[str, Any]:
+    def _breaking_route_keys(self, diff: Dict[str, Any]) -> Set[str]:
+        """"METHOD:path" keys of the modified routes whose changes are breaking."""
+        return {
+            f"{r['method']}:{r['path']}" for r in diff.get("modified_routes", [])
+            if self._is_breaking_change(r.get("changes", {}))
+        }
+
+    def _calculate_usage_impact(self, diff: Dict[str, Any], breaking: Optional[Set[str]] = None) -> Dict[str, Any]:
+        if breaking is None:
+            breaking = self._breaking_route_keys(diff)
+
+        removed = diff.get("removed_routes", [])
+        modified = diff.get("modified_routes", [])
+        usage = self.usage_data.get_route_usage_bulk(
+            {(route["method"], route["path"]) for route in removed + modified}
+        )
+
         removed_routes = []
         modified_routes = []
+        affected_routes = []
+        # Running totals, accumulated while the enriched lists are built
+        total_usage_count = 0
+        high = medium = low = 0
 
-        for route in diff.get("removed_routes", []):
-            usage_stats = self.usage_data.get_route_usage(route["method"], route["path"])
+        for route in removed:
+            affected_routes.append(f"{route['method']}:{route['path']}")
+            usage_stats = usage.get((route["method"], route["path"]))
             if usage_stats:
                 removed_routes.append(self._enrich_route_with_usage(route, usage_stats))
+                total_usage_count += usage_stats.call_count
 
-        for route in diff.get("modified_routes", []):
-            usage_stats = self.usage_data.get_route_usage(route["method"], route["path"])
+        for route in modified:
+            route_key = f"{route['method']}:{route['path']}"
+            is_breaking = route_key in breaking
+            if is_breaking:
+                affected_routes.append(route_key)
+            usage_stats = usage.get((route["method"], route["path"]))
             if usage_stats:
                 enriched_route = self._enrich_route_with_usage(route, usage_stats)
-                enriched_route["usage_stats"]["impact_score"] = self._calculate_route_impact_score(route, usage_stats)
+                route_score = self._calculate_route_impact_score(route, usage_stats, is_breaking)
+                enriched_route["usage_stats"]["impact_score"] = route_score
+                total_usage_count += usage_stats.call_count
+                if route_score > 70:
+                    high += 1
+                elif route_score >= 30:
+                    medium += 1
+                else:
+                    low += 1
 
                 if "request_schema_changes" in route.get("changes", {}) and                    route["changes"]["request_schema_changes"].get("has_changes"):
                     enriched_route["parameter_impact"] = self._analyze_parameter_impact(
@@ -55,16 +113,8 @@ class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
 
                 modified_routes.append(enriched_route)
 
-        affected_routes = [
-            f"{r['method']}:{r['path']}" for r in diff.get("removed_routes", [])
-        ] + [
-            f"{r['method']}:{r['path']}" for r in diff.get("modified_routes", [])
-            if self._is_breaking_change(r.get("changes", {}))
-        ]
-
         client_impact = self.usage_data.get_client_impact(affected_routes)
 
-        total_usage_count = sum(r["usage_stats"]["call_count"] for r in removed_routes + modified_routes)
         total_client_count = client_impact.get("affected_clients_count", 0)
 
         impact_score = min(100, (total_usage_count * 0.6 + total_client_count * 40)) if total_usage_count > 0 else 0
@@ -75,9 +125,9 @@ class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
             "client_impact": client_impact,
             "total_affected_requests": total_usage_count,
             "impact_score": round(impact_score, 2),
-            "high_impact_changes": len([r for r in modified_routes if r["usage_stats"]["impact_score"] > 70]),
-            "medium_impact_changes": len([r for r in modified_routes if 30 <= r["usage_stats"]["impact_score"] <= 70]),
-            "low_impact_changes": len([r for r in modified_routes if r["usage_stats"]["impact_score"] < 30]),
+            "high_impact_changes": high,
+            "medium_impact_changes": medium,
+            "low_impact_changes": low,
         }
 
     def _enrich_route_with_usage(self, route: Dict[str, Any], usage_stats) -> Dict[str, Any]:
@@ -91,34 +141,29 @@ class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
         }
         return enriched
 
-    def _analyze_test_impact(self, diff: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_test_impact(self, diff: Dict[str, Any], breaking: Optional[Set[str]] = None) -> Dict[str, Any]:
+        if breaking is None:
+            breaking = self._breaking_route_keys(diff)
+
+        # Removed routes plus breaking modified ones, fetched in one batch
+        affected = list(diff.get("removed_routes", [])) + [
+            route for route in diff.get("modified_routes", [])
+            if f"{route['method']}:{route['path']}" in breaking
+        ]
+        coverage_by_route = self.test_coverage.get_route_coverage_bulk(
+            {(route["method"], route["path"]) for route in affected}
+        )
+
         affected_routes = []
-        for route in diff.get("removed_routes", []):
-            route_key = f"{route['method']}:{route['path']}"
-            affected_routes.append(route_key)
-            coverage = self.test_coverage.get_route_coverage(route["method"], route["path"])
+        for route in affected:
+            affected_routes.append(f"{route['method']}:{route['path']}")
+            coverage = coverage_by_route.get((route["method"], route["path"]))
             if coverage:
                 route["test_coverage"] = coverage
 
-        for route in diff.get("modified_routes", []):
-            if self._is_breaking_change(route.get("changes", {})):
-                route_key = f"{route['method']}:{route['path']}"
-                affected_routes.append(route_key)
-                coverage = self.test_coverage.get_route_coverage(route["method"], route["path"])
-                if coverage:
-                    route["test_coverage"] = coverage
-
         affected_tests = self.test_coverage.get_affected_tests(affected_routes)
 
-        all_routes = {
-            f"{method.upper()}:{path}"
-            for contract in [self.old_contract, self.new_contract]
-            for path, path_item in contract.get("paths", {}).items()
-            for method in path_item.keys()
-            if method in {"get", "post", "put", "delete", "patch"}
-        }
-
-        coverage_gap = self.test_coverage.get_coverage_gap_report(list(all_routes))
+        coverage_gap = self.test_coverage.get_coverage_gap_report(list(self._all_route_keys()))
 
         return {
             "affected_tests_count": len(affected_tests),
@@ -136,8 +181,10 @@ class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
             ]
         }
 
-    def _calculate_route_impact_score(self, route: Dict[str, Any], usage_stats) -> float:
-        base_score = 50 if self._is_breaking_change(route.get("changes", {})) else 20
+    def _calculate_route_impact_score(self, route: Dict[str, Any], usage_stats, is_breaking: Optional[bool] = None) -> float:
+        if is_breaking is None:
+            is_breaking = self._is_breaking_change(route.get("changes", {}))
+        base_score = 50 if is_breaking else 20
 
         if usage_stats.call_count > 1000:
             base_score += 30
@@ -160,9 +207,12 @@ class UsageAwareDriftAnalyzer(ContractDriftAnalyzer):
         if req.get("removed_properties") or req.get("required_fields_changed"):
             return True
 
-        for status, resp in changes.get("response_changes", {}).items():
-            if (resp.get("type") == "removed" and status.startswith("2")) or                (resp.get("type") == "modified" and resp.get("schema_changes", {}).get("removed_properties")):
-                return True
+        if any(
+            (resp.get("type") == "removed" and status.startswith("2"))
+            or (resp.get("type") == "modified" and resp.get("schema_changes", {}).get("removed_properties"))
+            for status, resp in changes.get("response_changes", {}).items()
+        ):
+            return True
 
         param_changes = changes.get("parameter_changes", {})
         if param_changes.get("removed_parameters") or param_changes.get("modified_parameters"):
@@ -0,0 +1,193 @@
+"""
+Compile-once caches for request body schemas.
+
+Contract schemas are fixed for the life of the server, so anything derived
+from one is built on first use and reused for every later request. Entries
+are keyed by a hash of the schema's content, so contracts with identical
+body schemas share one validator. The hash itself is remembered per schema
+object in a bounded ``IdentityCache``, so a request only pays for a dict
+lookup.
+"""
+
+import hashlib
+import itertools
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import Draft4Validator, Draft6Validator, Draft7Validator, validator_for
+
+from schema.codegen import compile_check
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# fastjsonschema implements these drafts only; anything newer, including
+# jsonschema's 2020-12 default for schemas without $schema, skips it
+_FASTJSONSCHEMA_DRAFTS = (Draft4Validator, Draft6Validator, Draft7Validator)
+
+Transform = Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]
+
+SchemaKey = Union[bytes, Tuple[str, int]]
+
+# (content key, transform) -> compiled check, or None if no compiler can handle it
+_COMPILED: Dict[Tuple[SchemaKey, Transform], Optional[Callable[[Any], Any]]] = {}
+
+# (content key, transform, validator class) -> jsonschema validator
+_VALIDATORS: Dict[Tuple[SchemaKey, Transform, Optional[type]], Any] = {}
+
+
+class IdentityCache:
+    """
+    Values derived from objects, looked up by the object's identity.
+
+    A hit is a dict lookup plus an ``is`` check, so unhashable dicts work as
+    keys. Each entry keeps its object alive, which pins the id; past
+    ``maxsize`` the least recently used entry is dropped. Cached objects are
+    assumed not to change: after mutating or reloading contracts, call
+    ``clear_identity_caches``.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, Tuple[Any, Any]]" = OrderedDict()
+        _IDENTITY_CACHES.append(self)
+
+    def get(self, obj: Any, build: Callable[[Any], Any]) -> Any:
+        """The value for ``obj``, computing it with ``build(obj)`` on a miss."""
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            self._entries.move_to_end(id(obj))
+            return entry[1]
+        value = build(obj)
+        self._entries[id(obj)] = (obj, value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_IDENTITY_CACHES: List[IdentityCache] = []
+
+
+def clear_identity_caches() -> None:
+    """Forget everything cached by object identity, e.g. after contracts are reloaded."""
+    for cache in _IDENTITY_CACHES:
+        cache.clear()
+
+
+# schema -> content key, so each schema object is hashed once
+_SCHEMA_KEYS = IdentityCache()
+
+# Keys for schemas that can't be hashed by content. A fresh number rather
+# than id(): once such a schema is evicted its id may be reused
+_UNHASHABLE_KEYS = itertools.count()
+
+
+def _content_key(schema: Dict[str, Any]) -> SchemaKey:
+    try:
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return ("object", next(_UNHASHABLE_KEYS))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+def schema_key(schema: Dict[str, Any]) -> SchemaKey:
+    """
+    Content hash of ``schema``: structurally equal schemas, e.g. the same body
+    shape repeated across contracts, get the same key and share one compiled
+    validator. A schema that isn't plain JSON gets a key of its own instead.
+    """
+    return _SCHEMA_KEYS.get(schema, _content_key)
+
+
+def get_validator(schema: Dict[str, Any], transform: Transform = None, cls: Optional[type] = None):
+    """
+    A ready jsonschema validator for ``schema`` (after ``transform``).
+
+    With no ``cls`` this mirrors ``jsonschema.validate``: the class is picked
+    from the schema's ``$schema`` and ``check_schema`` runs, but only once
+    rather than on every validation. An explicit ``cls`` is used as is.
+    """
+    key = (schema_key(schema), transform, cls)
+    validator = _VALIDATORS.get(key)
+    if validator is not None:
+        return validator
+
+    effective = transform(schema) if transform else schema
+    if cls is None:
+        validator_cls = validator_for(effective)
+        validator_cls.check_schema(effective)
+    else:
+        validator_cls = cls
+    validator = validator_cls(effective)
+    _VALIDATORS[key] = validator
+    return validator
+
+
+def warm_validators(schemas: Iterable[Dict[str, Any]], transform: Transform = None) -> None:
+    """Build the cached validators for ``schemas`` now instead of on first request."""
+    for schema in schemas:
+        if not schema:
+            continue
+        _compiled_check(schema, transform)
+        try:
+            get_validator(schema, transform)
+        except SchemaError:
+            pass  # left to surface on the request that uses it, as before
+
+
+def _fastjsonschema_check(schema: Dict[str, Any]) -> Callable[[Any], bool]:
+    # use_default=False: the check must not write defaults into the request body
+    validate = fastjsonschema.compile(schema, use_default=False)
+
+    def check(instance: Any) -> bool:
+        try:
+            validate(instance)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return check
+
+
+def _compiled_check(schema: Dict[str, Any], transform: Transform) -> Optional[Callable[[Any], bool]]:
+    key = (schema_key(schema), transform)
+    if key in _COMPILED:
+        return _COMPILED[key]
+
+    effective = transform(schema) if transform else schema
+    check = None
+    if fastjsonschema is not None:
+        try:
+            if validator_for(effective) in _FASTJSONSCHEMA_DRAFTS:
+                check = _fastjsonschema_check(effective)
+        except Exception:
+            pass
+    if check is None:
+        # Our own generator covers the simple schemas typical of mocked bodies
+        check = compile_check(effective)
+    _COMPILED[key] = check
+    return check
+
+
+def fast_is_valid(schema: Dict[str, Any], instance: Any, transform: Transform = None) -> bool:
+    """
+    True if ``instance`` passes the compiled validator for ``schema``
+    (after ``transform``, e.g. strict mode's rewrite, if given).
+
+    The check comes from fastjsonschema when it is installed, the schema is
+    draft 4, 6 or 7 and it compiles, otherwise from ``schema.codegen``. A False result is not a
+    verdict: neither may support the schema, and both may be stricter than
+    jsonschema (fastjsonschema checks ``format`` by default). Callers fall
+    back to jsonschema on False, which also produces the detailed error.
+    """
+    check = _compiled_check(schema, transform)
+    return check is not None and check(instance)
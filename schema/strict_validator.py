@@ -1,13 +1,142 @@
+import copy
 import json
-from typing import Dict, List, Any, Optional, Tuple, Union, Set
-from jsonschema import validate, ValidationError as JsonSchemaError
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union, Set
+from jsonschema import ValidationError as JsonSchemaError
 from jsonschema.exceptions import best_match
 
 from contract.contract_entry import ContractEntry  # Fixed import
+from schema.schema_cache import IdentityCache, fast_is_valid, get_validator, warm_validators
+
+# schema -> its strict rewrite
+_STRICT_CACHE = IdentityCache()
+
+# schema -> whether its strict errors name exactly the fields find_extra_fields reports
+_CLOSED_SCHEMAS = IdentityCache()
+
+# Keywords that can't make jsonschema look at fields find_extra_fields skips
+_CLOSED_KEYWORDS = frozenset({
+    "type", "properties", "items", "required", "additionalProperties",
+    "enum", "const", "format", "pattern", "minLength", "maxLength",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf",
+    "minItems", "maxItems", "uniqueItems", "minProperties", "maxProperties",
+    "$schema", "$id", "id", "$comment", "title", "description", "default",
+    "examples", "definitions", "$defs", "readOnly", "writeOnly", "deprecated",
+})
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """Compiled ``patternProperties`` keys; schemas share them across requests."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+def _strictify(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A deep copy of ``schema`` with ``additionalProperties: false`` added to
+    every object schema that doesn't set it, through properties, items and
+    oneOf/anyOf/allOf. The copy is rewritten in place, never the original.
+    """
+    root = copy.deepcopy(schema)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.get("type") == "object" and "additionalProperties" not in node:
+            node["additionalProperties"] = False
+
+        properties = node.get("properties")
+        if isinstance(properties, dict):
+            stack.extend(s for s in properties.values() if isinstance(s, dict))
+
+        items = node.get("items")
+        if isinstance(items, dict):
+            stack.append(items)
+
+        for key in ("oneOf", "anyOf", "allOf"):
+            subschemas = node.get(key)
+            if isinstance(subschemas, list):
+                stack.extend(s for s in subschemas if isinstance(s, dict))
+    return root
+
+
+def _closed_node(node: Any, in_items: bool = False) -> bool:
+    if isinstance(node, bool):
+        return True
+    if not isinstance(node, dict) or not _CLOSED_KEYWORDS.issuperset(node):
+        return False
+    if node.get("additionalProperties", False) is not False:
+        return False  # left open by _strictify
+
+    properties = node.get("properties")
+    if properties is not None:
+        if not isinstance(properties, dict) or node.get("type") != "object":
+            return False
+        if not all(_closed_node(subschema) for subschema in properties.values()):
+            return False
+
+    items = node.get("items")
+    if items is not None:
+        # find_extra_fields only follows items one level below a property
+        if in_items or not isinstance(items, dict):
+            return False
+        return _closed_node(items, in_items=True)
+    return True
+
+
+def _is_closed(schema: Dict[str, Any]) -> bool:
+    """
+    True if, in strict mode, the ``additionalProperties`` errors for
+    ``schema`` flag exactly the fields ``find_extra_fields`` would: every
+    object is closed and nothing routes fields through combinators, refs,
+    pattern properties or nested arrays.
+    """
+    return (isinstance(schema, dict) and schema.get("type") == "object"
+            and "items" not in schema and _closed_node(schema))
+
+
+def _document_position(data: Any, parts: List[Any]) -> Tuple[int, ...]:
+    position = []
+    for part in parts:
+        position.append(list(data).index(part) if isinstance(data, dict) else part)
+        data = data[part]
+    return tuple(position)
+
+
+def _extra_field_paths(errors: Iterable[JsonSchemaError], data: Any) -> List[str]:
+    """
+    Dotted paths of the fields rejected by ``additionalProperties: false`` in
+    ``errors``, in document order like ``find_extra_fields``.
+    """
+    found = []
+    for error in errors:
+        if error.validator != "additionalProperties" or error.validator_value is not False:
+            continue
+        if not isinstance(error.instance, dict):
+            continue
+
+        parts = list(error.absolute_path)
+        prefix = ""
+        for part in parts:
+            if isinstance(part, int):
+                prefix += f"[{part}]"
+            else:
+                prefix = f"{prefix}.{part}" if prefix else str(part)
+
+        properties = error.schema.get("properties", {})
+        for key in error.instance:
+            if key not in properties:
+                path = f"{prefix}.{key}" if prefix else key
+                found.append((_document_position(data, parts + [key]), path))
+    found.sort()
+    return [path for _, path in found]
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors with structured details."""
 
+    __slots__ = ("message", "error_type", "field", "details", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -72,28 +201,17 @@ class StrictSchemaValidator:
     def _enforce_no_additional_properties(schema: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(schema, dict):
             return schema
+        return _STRICT_CACHE.get(schema, _strictify)
 
-        schema_copy = dict(schema)
-
-        if schema_copy.get("type") == "object" and "additionalProperties" not in schema_copy:
-            schema_copy["additionalProperties"] = False
-
-        if "properties" in schema_copy and isinstance(schema_copy["properties"], dict):
-            properties = schema_copy["properties"]
-            for prop_name, prop_schema in properties.items():
-                properties[prop_name] = StrictSchemaValidator._enforce_no_additional_properties(prop_schema)
-
-        if "items" in schema_copy and isinstance(schema_copy["items"], dict):
-            schema_copy["items"] = StrictSchemaValidator._enforce_no_additional_properties(schema_copy["items"])
-
-        for key in ("oneOf", "anyOf", "allOf"):
-            if key in schema_copy and isinstance(schema_copy[key], list):
-                schema_copy[key] = [
-                    StrictSchemaValidator._enforce_no_additional_properties(s)
-                    for s in schema_copy[key]
-                ]
-
-        return schema_copy
+    @staticmethod
+    def _body_errors(contract: ContractEntry, request_body: Any, strict: bool) -> List[JsonSchemaError]:
+        """Every jsonschema error for a non-None ``request_body``, from a single pass."""
+        # Compiled check for the common valid case; jsonschema decides otherwise
+        transform = StrictSchemaValidator._enforce_no_additional_properties if strict else None
+        if fast_is_valid(contract.request_body_schema, request_body, transform):
+            return []
+        validator = get_validator(contract.request_body_schema, transform)
+        return list(validator.iter_errors(request_body))
 
     @staticmethod
     def validate_request_body(contract: ContractEntry, request_body: Any, strict: bool = True) -> Tuple[bool, Optional[ValidationError]]:
@@ -106,62 +224,82 @@ class StrictSchemaValidator:
                 error_type="missing_body"
             )
 
-        try:
-            schema = contract.request_body_schema
-            if strict:
-                schema = StrictSchemaValidator._enforce_no_additional_properties(schema)
-            validate(instance=request_body, schema=schema)
+        errors = StrictSchemaValidator._body_errors(contract, request_body, strict)
+        if not errors:
             return True, None
-        except JsonSchemaError as e:
-            return False, ValidationError.from_jsonschema_error(e)
+        return False, ValidationError.from_jsonschema_error(best_match(errors))
+
+    @staticmethod
+    def warm_validators(contracts: Iterable[ContractEntry], strict: bool = True) -> None:
+        """Compile the body validators for ``contracts`` up front, e.g. at server startup."""
+        transform = StrictSchemaValidator._enforce_no_additional_properties if strict else None
+        warm_validators((contract.request_body_schema for contract in contracts), transform)
 
     @staticmethod
     def find_extra_fields(schema: Dict[str, Any], data: Any, path: str = "") -> List[str]:
+        """
+        Dotted paths of fields in ``data`` that ``schema`` doesn't declare.
+
+        Walks nested objects and arrays of objects with an explicit stack,
+        reporting fields in document order.
+        """
         extra_fields = []
-        if not isinstance(data, dict) or schema.get("type") != "object":
-            return extra_fields
-
-        properties = schema.get("properties", {})
-        property_names = set(properties.keys())
-
-        pattern_props = schema.get("patternProperties", {})
-        if pattern_props:
-            import re
-            for pattern in pattern_props:
-                for key in data.keys():
-                    if re.match(pattern, key):
-                        property_names.add(key)
-
-        for key, value in data.items():
-            current_path = f"{path}.{key}" if path else key
-            if key not in property_names:
-                extra_fields.append(current_path)
-            elif key in properties and isinstance(value, dict) and isinstance(properties[key], dict):
-                extra_fields.extend(
-                    StrictSchemaValidator.find_extra_fields(properties[key], value, current_path)
-                )
-            elif (key in properties and isinstance(value, list) and
-                  isinstance(properties[key], dict) and "items" in properties[key]):
-                items_schema = properties[key].get("items", {})
-                for i, item in enumerate(value):
-                    item_path = f"{current_path}[{i}]"
-                    if isinstance(item, dict):
-                        extra_fields.extend(
-                            StrictSchemaValidator.find_extra_fields(items_schema, item, item_path)
+        # Items are either (schema, data, path) to inspect or a str path to report
+        stack: List[Union[str, Tuple[Dict[str, Any], Any, str]]] = [(schema, data, path)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                extra_fields.append(item)
+                continue
+
+            schema, data, path = item
+            if not isinstance(data, dict) or schema.get("type") != "object":
+                continue
+
+            properties = schema.get("properties", {})
+            patterns = _compile_patterns(tuple(schema.get("patternProperties", ())))
+
+            pending = []
+            for key, value in data.items():
+                current_path = f"{path}.{key}" if path else key
+                if key in properties:
+                    prop_schema = properties[key]
+                    if isinstance(value, dict) and isinstance(prop_schema, dict):
+                        pending.append((prop_schema, value, current_path))
+                    elif isinstance(value, list) and isinstance(prop_schema, dict) and "items" in prop_schema:
+                        items_schema = prop_schema.get("items", {})
+                        pending.extend(
+                            (items_schema, entry, f"{current_path}[{i}]")
+                            for i, entry in enumerate(value) if isinstance(entry, dict)
                         )
+                elif not any(pattern.match(key) for pattern in patterns):
+                    pending.append(current_path)
+
+            stack.extend(reversed(pending))
 
         return extra_fields
 
     @staticmethod
-    def generate_extra_fields_error(schema: Dict[str, Any], data: Any) -> Optional[ValidationError]:
-        extra_fields = StrictSchemaValidator.find_extra_fields(schema, data)
+    def generate_extra_fields_error(schema: Dict[str, Any], data: Any,
+                                    strict_errors: Optional[List[JsonSchemaError]] = None) -> Optional[ValidationError]:
+        """
+        The extra_fields error for ``data``, or None if every field is declared.
+
+        ``strict_errors``, the strict-mode errors already collected for
+        ``data``, are reused when they carry the same answer; otherwise the
+        payload is walked with ``find_extra_fields``.
+        """
+        if strict_errors is not None and _CLOSED_SCHEMAS.get(schema, _is_closed):
+            extra_fields = _extra_field_paths(strict_errors, data)
+        else:
+            extra_fields = StrictSchemaValidator.find_extra_fields(schema, data)
         if extra_fields:
             return ValidationError(
                 message=f"Request contains {len(extra_fields)} field(s) not defined in the schema",
                 error_type="extra_fields",
                 details={
                     "extra_fields": extra_fields,
-                    "allowed_fields": list(schema.get("properties", {}).keys())
+                    "allowed_fields": list(schema.get("properties", {}))
                 }
             )
         return None
@@ -177,15 +315,21 @@ class StrictSchemaValidator:
         errors = []
 
         if contract.request_body_schema:
-            is_valid, body_error = StrictSchemaValidator.validate_request_body(contract, request_body, strict)
-            if not is_valid:
-                errors.append(body_error)
-                if body_error.error_type != "extra_field" and request_body is not None:
-                    extra_fields_error = StrictSchemaValidator.generate_extra_fields_error(
-                        contract.request_body_schema, request_body
-                    )
-                    if extra_fields_error:
-                        errors.append(extra_fields_error)
+            if request_body is None:
+                _, missing_body = StrictSchemaValidator.validate_request_body(contract, request_body, strict)
+                errors.append(missing_body)
+            else:
+                # One error pass; in strict mode it also supplies the extra fields
+                body_errors = StrictSchemaValidator._body_errors(contract, request_body, strict)
+                if body_errors:
+                    body_error = ValidationError.from_jsonschema_error(best_match(body_errors))
+                    errors.append(body_error)
+                    if body_error.error_type != "extra_field":
+                        extra_fields_error = StrictSchemaValidator.generate_extra_fields_error(
+                            contract.request_body_schema, request_body, body_errors if strict else None
+                        )
+                        if extra_fields_error:
+                            errors.append(extra_fields_error)
 
         # Placeholder: Add header/query validation as needed
 
@@ -68,15 +68,13 @@ def example_usage():
 
     print("\n📦 JSON parse + validate flow:")
     json_str = '{"name": "John", "email": "john@example.com"}'
-    parsed_body, parse_error = SchemaValidator.parse_json_safely(json_str)
+    is_valid, result = SchemaValidator.parse_and_validate(contract, json_str)
 
-    if parse_error:
-        print("JSON parsing error:", parse_error['message'])
+    if is_valid:
+        print("Parsed body:", result)
     else:
-        is_valid, validation_error = SchemaValidator.validate_request_body(contract, parsed_body)
-        if not is_valid:
-            print("Validation error:", validation_error["message"])
-            print("Details:", validation_error.get("details"))
+        print("Validation error:", result["message"])
+        print("Details:", result.get("details"))
 
 
 # Optional: run example when file is executed directly
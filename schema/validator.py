@@ -1,17 +1,48 @@
 import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Union
-from jsonschema import validate, ValidationError as JsonSchemaError, Draft7Validator
+from jsonschema import ValidationError as JsonSchemaError, Draft7Validator
 from jsonschema.exceptions import best_match
 
 from contract.contract_entry import ContractEntry
+from schema.schema_cache import IdentityCache, fast_is_valid, get_validator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# request_headers -> ((name, name.lower(), expected), ...)
+_EXPECTED_HEADERS = IdentityCache()
+
+
+def _header_triples(request_headers: Dict[str, Any]) -> Tuple[Tuple[str, str, Any], ...]:
+    return tuple((name, name.lower(), value) for name, value in request_headers.items())
+
+
+def _expected_headers(request_headers: Dict[str, Any]) -> Tuple[Tuple[str, str, Any], ...]:
+    return _EXPECTED_HEADERS.get(request_headers, _header_triples)
+
+
+# query_parameters -> names of the required ones, in declaration order
+_REQUIRED_QUERY = IdentityCache()
+
+
+def _required_names(query_parameters: Dict[str, Any]) -> Tuple[str, ...]:
+    return tuple(name for name, definition in query_parameters.items() if definition.required)
+
+
+def _required_query(query_parameters: Dict[str, Any]) -> Tuple[str, ...]:
+    return _REQUIRED_QUERY.get(query_parameters, _required_names)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors with structured details."""
 
+    __slots__ = ("message", "error_type", "field", "details")
+
     def __init__(self,
                  message: str,
                  error_type: str = "schema_violation",
@@ -65,11 +96,17 @@ class SchemaValidator:
                 error_type="missing_body"
             ).to_dict()
 
-        try:
-            validate(instance=request_body, schema=contract.request_body_schema)
+        # Compiled check for the common valid case; jsonschema decides otherwise
+        if fast_is_valid(contract.request_body_schema, request_body):
             return True, None
-        except JsonSchemaError as e:
-            return False, ValidationError.from_jsonschema_error(e).to_dict()
+
+        # is_valid stops at the first failure; errors are only collected (and
+        # ranked exactly as jsonschema.validate would) when there are some
+        validator = get_validator(contract.request_body_schema)
+        if validator.is_valid(request_body):
+            return True, None
+        error = best_match(validator.iter_errors(request_body))
+        return False, ValidationError.from_jsonschema_error(error).to_dict()
 
     @staticmethod
     def validate_request_headers(contract: ContractEntry, headers: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, Any]]]:
@@ -79,23 +116,22 @@ class SchemaValidator:
         missing = []
         invalid = []
 
-        for name, expected in contract.request_headers.items():
-            name_lower = name.lower()
-            found = False
-
-            for actual_name, actual_value in headers.items():
-                if actual_name.lower() == name_lower:
-                    found = True
-                    if expected is not None and actual_value != expected:
-                        invalid.append({
-                            "name": name,
-                            "expected": expected,
-                            "actual": actual_value
-                        })
-                    break
-
-            if not found:
+        # First occurrence wins for repeated headers, as with the old linear scan
+        actual_by_name = {}
+        for actual_name, actual_value in headers.items():
+            actual_by_name.setdefault(actual_name.lower(), actual_value)
+
+        for name, name_lower, expected in _expected_headers(contract.request_headers):
+            if name_lower not in actual_by_name:
                 missing.append(name)
+                continue
+            actual_value = actual_by_name[name_lower]
+            if expected is not None and actual_value != expected:
+                invalid.append({
+                    "name": name,
+                    "expected": expected,
+                    "actual": actual_value
+                })
 
         if missing or invalid:
             details = {}
@@ -117,10 +153,7 @@ class SchemaValidator:
         if not contract.query_parameters:
             return True, None
 
-        missing = []
-        for param, definition in contract.query_parameters.items():
-            if definition.required and param not in query_params:
-                missing.append(param)
+        missing = [param for param in _required_query(contract.query_parameters) if param not in query_params]
 
         if missing:
             return False, ValidationError(
@@ -138,13 +171,16 @@ class SchemaValidator:
         headers: Optional[Dict[str, str]] = None,
         query_params: Optional[Dict[str, str]] = None
     ) -> List[Dict[str, Any]]:
-        errors = []
+        """
+        Every problem with the request as a list of error dicts.
+
+        The body is checked in one ``iter_errors`` pass, so each schema
+        violation is reported rather than only the best match.
+        """
         headers = headers or {}
         query_params = query_params or {}
 
-        is_valid, err = SchemaValidator.validate_request_body(contract, request_body)
-        if not is_valid:
-            errors.append(err)
+        errors = SchemaValidator._body_errors(contract, request_body)
 
         is_valid, err = SchemaValidator.validate_request_headers(contract, headers)
         if not is_valid:
@@ -156,14 +192,52 @@ class SchemaValidator:
 
         return errors
 
+    @staticmethod
+    def _body_errors(contract: ContractEntry, request_body: Any) -> List[Dict[str, Any]]:
+        schema = contract.request_body_schema
+        if not schema:
+            return []
+        if request_body is None:
+            return [ValidationError(
+                message="Request body is required but none was provided",
+                error_type="missing_body"
+            ).to_dict()]
+        if fast_is_valid(schema, request_body):
+            return []
+        validator = get_validator(schema)
+        return [ValidationError.from_jsonschema_error(e).to_dict() for e in validator.iter_errors(request_body)]
+
     @staticmethod
     def find_all_schema_errors(schema: Dict[str, Any], data: Any) -> List[Dict[str, Any]]:
-        validator = Draft7Validator(schema)
+        validator = get_validator(schema, cls=Draft7Validator)
         errors = list(validator.iter_errors(data))
         return [ValidationError.from_jsonschema_error(e).to_dict() for e in errors]
 
     @staticmethod
-    def parse_json_safely(json_str: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    def parse_and_validate(contract: ContractEntry, raw: Union[str, bytes]) -> Tuple[bool, Any]:
+        """
+        Parse a raw JSON body and validate it against the contract's schema.
+
+        Returns ``(True, parsed body)`` on success, otherwise ``(False, error
+        dict)`` for either invalid JSON or a schema violation.
+        """
+        request_body, error = SchemaValidator.parse_json_safely(raw)
+        if error:
+            return False, error
+        is_valid, error = SchemaValidator.validate_request_body(contract, request_body)
+        if not is_valid:
+            return False, error
+        return True, request_body
+
+    @staticmethod
+    def parse_json_safely(json_str: Union[str, bytes]) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        if orjson is not None:
+            try:
+                return orjson.loads(json_str), None
+            except orjson.JSONDecodeError:
+                # orjson is stricter (NaN, integers past 64 bits); json has the
+                # last word and supplies the error message
+                pass
         try:
             return json.loads(json_str), None
         except json.JSONDecodeError as e:
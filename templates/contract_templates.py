@@ -1,16 +1,8 @@
 # templates.py
-def get_template_content(template_type: str) -> str:
-    """
-    Get the content for a template contract file.
-    
-    Args:
-        template_type: Type of template to get ("basic", "full", or "openapi")
-        
-    Returns:
-        YAML content for the template
-    """
-    if template_type == "basic":
-        return """# Basic Mock API Contract
+
+# YAML content for each template type
+_TEMPLATES = {
+    "basic": """# Basic Mock API Contract
 routes:
   - path: /hello
     method: GET
@@ -42,9 +34,8 @@ routes:
         id: "{userId}"
         name: "User {userId}"
         email: "user{userId}@example.com"
-"""
-    elif template_type == "full":
-        return """# Full-featured Mock API Contract
+""",
+    "full": """# Full-featured Mock API Contract
 routes:
   - id: get_users
     path: /api/users
@@ -144,9 +135,8 @@ routes:
       body:
         error: "User not found"
         message: "No user found with ID {userId}"
-"""
-    elif template_type == "openapi":
-        return """# OpenAPI-style Mock API Contract
+""",
+    "openapi": """# OpenAPI-style Mock API Contract
 openapi: "3.0.0"
 info:
   title: "Sample API"
@@ -217,6 +207,21 @@ routes:
         id: "{petId}"
         name: "Pet {petId}"
         tag: "tag{petId}"
-"""
-    else:
-        raise ValueError(f"Unknown template type: {template_type}")
\ No newline at end of file
+""",
+}
+
+
+def get_template_content(template_type: str) -> str:
+    """
+    Get the content for a template contract file.
+    
+    Args:
+        template_type: Type of template to get ("basic", "full", or "openapi")
+        
+    Returns:
+        YAML content for the template
+    """
+    try:
+        return _TEMPLATES[template_type]
+    except KeyError:
+        raise ValueError(f"Unknown template type: {template_type}") from None
@@ -9,6 +9,8 @@ class TemplateRegistry:
         :param user_template_dirs: Optional list of user-defined template directories
         """
         self.templates = {}
+        # name -> compiled template, filled on first use
+        self._compiled: Dict[str, jinja2.Template] = {}
         self.jinja_env = self._create_jinja_environment(user_template_dirs)
         self._register_built_in_templates()
 
@@ -26,7 +28,11 @@ class TemplateRegistry:
             loader=jinja2.FileSystemLoader(search_paths),
             autoescape=jinja2.select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            # Templates are only read at startup; compiled ones are kept in
+            # self._compiled and their bytecode on disk for the next process
+            auto_reload=False,
+            bytecode_cache=jinja2.FileSystemBytecodeCache()
         )
 
         # Register useful filters
@@ -53,6 +59,7 @@ class TemplateRegistry:
         :param template_path: Relative path to the template file
         """
         self.templates[name] = template_path
+        self._compiled.pop(name, None)
 
     def get_template(self, name: str) -> jinja2.Template:
         """
@@ -60,16 +67,22 @@ class TemplateRegistry:
         :param name: Name of the registered template
         :raises ValueError: If the template name is not found
         """
+        template = self._compiled.get(name)
+        if template is not None:
+            return template
         if name not in self.templates:
             raise ValueError(f"Template '{name}' not registered")
-        return self.jinja_env.get_template(self.templates[name])
+        template = self._compiled[name] = self.jinja_env.get_template(self.templates[name])
+        return template
 
     def render_template(self, name: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Render the specified template with the given context.
         :param name: Name of the registered template
-        :param context: Dictionary of values to pass to the template
+        :param context: Mapping of values to pass to the template
         :return: Rendered template string
         """
         template = self.get_template(name)
-        return template.render(**(context or {}))
+        # Passed positionally: Jinja copies it into its context once, where
+        # ** unpacking would build an extra intermediate dict.
+        return template.render(context or {})
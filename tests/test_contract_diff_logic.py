@@ -21,25 +21,29 @@ def format_changes_as_html(changes):
 
     html.append("<h2>API Contract Compatibility Report</h2>")
 
-    breaking_route = [s for s in changes if s.is_breaking]
-    non_breaking_route = [s for s in changes if not s.is_breaking]
-
-    if breaking_route:
+    # One pass over the changes, rendering each into its group's item list
+    breaking_items = []
+    non_breaking_items = []
+    for change in changes:
+        if change.is_breaking:
+            summary = change.get_summary_text().removeprefix("[BREAKING] ")
+            breaking_items.append(f"<li><strong>{change.change_type.name}</strong>: {summary}</li>")
+        else:
+            summary = change.get_summary_text().removeprefix("[NON-BREAKING] ")
+            non_breaking_items.append(f"<li><strong>{change.change_type.name}</strong>: {summary}</li>")
+
+    if breaking_items:
         html.append("<h3 class='breaking'>🚫 Breaking Changes</h3>")
         html.append("<ul>")
-        for change in breaking_route:
-            summary = change.get_summary_text().replace("[BREAKING] ", "")
-            html.append(f"<li><strong>{change.change_type.name}</strong>: {summary}</li>")
+        html.extend(breaking_items)
         html.append("</ul>")
     else:
         html.append("<p class='breaking'>No breaking changes detected.</p>")
 
-    if non_breaking_route:
+    if non_breaking_items:
         html.append("<h3 class='non-breaking'>✅ Non-Breaking Changes</h3>")
         html.append("<ul>")
-        for change in non_breaking_route:
-            summary = change.get_summary_text().replace("[NON-BREAKING] ", "")
-            html.append(f"<li><strong>{change.change_type.name}</strong>: {summary}</li>")
+        html.extend(non_breaking_items)
         html.append("</ul>")
     else:
         html.append("<p class='non-breaking'>No non-breaking changes detected.</p>")
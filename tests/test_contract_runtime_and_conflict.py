@@ -1,50 +1,16 @@
 import sys
-import importlib.util
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
-# Base directory
+# Base directory, importable so the modules under test load normally
 BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
 
-# ----- Load contract.contract_entry -----
-contract_entry_path = BASE_DIR / "contract" / "contract_entry.py"
-spec_entry = importlib.util.spec_from_file_location("contract.contract_entry", str(contract_entry_path))
-entry_module = importlib.util.module_from_spec(spec_entry)
-sys.modules["contract.contract_entry"] = entry_module
-spec_entry.loader.exec_module(entry_module)
-
-# ----- Load contract.contract_loader -----
-contract_loader_path = BASE_DIR / "contract" / "contract_loader.py"
-spec_loader = importlib.util.spec_from_file_location("contract.contract_loader", str(contract_loader_path))
-contract_loader_module = importlib.util.module_from_spec(spec_loader)
-sys.modules["contract.contract_loader"] = contract_loader_module
-spec_loader.loader.exec_module(contract_loader_module)
-ContractLoader = contract_loader_module.ContractLoader
-ContractLoadError = contract_loader_module.ContractLoadError
-
-# ----- Load router.route_registry -----
-route_registry_path = BASE_DIR / "router" / "route_registry.py"
-spec_registry = importlib.util.spec_from_file_location("router.route_registry", str(route_registry_path))
-router_registry_module = importlib.util.module_from_spec(spec_registry)
-sys.modules["router.route_registry"] = router_registry_module
-spec_registry.loader.exec_module(router_registry_module)
-
-# ----- Load schema.validator -----
-schema_validator_path = BASE_DIR / "schema" / "validator.py"
-spec_validator = importlib.util.spec_from_file_location("schema.validator", str(schema_validator_path))
-validator_module = importlib.util.module_from_spec(spec_validator)
-sys.modules["schema.validator"] = validator_module
-spec_validator.loader.exec_module(validator_module)
-
-# ----- Load core.server -----
-server_path = BASE_DIR / "core" / "server.py"
-spec_server = importlib.util.spec_from_file_location("core.server", str(server_path))
-server_module = importlib.util.module_from_spec(spec_server)
-sys.modules["core.server"] = server_module
-spec_server.loader.exec_module(server_module)
-start_server = server_module.start_server
+from contract.contract_loader import ContractLoader, ContractLoadError
+from core.server import start_server
 
 
 # ==============================
@@ -0,0 +1,40 @@
+import pytest
+
+from schema import schema_cache
+from schema.schema_cache import fast_is_valid
+
+DRAFT7 = "http://json-schema.org/draft-07/schema#"
+
+
+# No $schema means 2020-12 to jsonschema, which fastjsonschema doesn't implement;
+# each body is invalid there and must not pass the fast path
+@pytest.mark.parametrize("schema, body", [
+    ({"type": "object", "dependentRequired": {"a": ["b"]}}, {"a": 1}),
+    ({"type": "object", "properties": {"a": {}}, "unevaluatedProperties": False}, {"a": 1, "z": 2}),
+    ({"type": "array", "prefixItems": [{"type": "string"}]}, [1]),
+    ({"type": "array", "contains": {"type": "string"}, "minContains": 2}, ["a", 1]),
+    ({"$defs": {"s": {"type": "string"}}, "properties": {"a": {"$ref": "#/$defs/s", "minLength": 3}}}, {"a": "x"}),
+])
+def test_newer_draft_schemas_do_not_pass_invalid_bodies(schema, body):
+    assert fast_is_valid(schema, body) is False
+
+
+def test_fastjsonschema_does_not_fill_in_defaults():
+    pytest.importorskip("fastjsonschema")
+    schema = {
+        "$schema": DRAFT7,
+        "type": "object",
+        "properties": {"a": {"type": "integer", "default": 5}},
+    }
+    body = {}
+    assert fast_is_valid(schema, body) is True
+    assert body == {}
+
+
+def test_fastjsonschema_is_used_for_draft7_only():
+    pytest.importorskip("fastjsonschema")
+    schema = {"type": "object", "properties": {"a": {"type": "string", "minLength": 1}}}
+    newer = schema_cache._compiled_check(schema, None)
+    older = schema_cache._compiled_check(dict(schema, **{"$schema": DRAFT7}), None)
+    assert "_fastjsonschema_check" not in newer.__qualname__
+    assert "_fastjsonschema_check" in older.__qualname__
@@ -0,0 +1,53 @@
+import pytest
+
+from schema.codegen import compile_check
+
+USER_SCHEMA = {
+    "type": "object",
+    "required": ["name", "email"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "email": {"type": "string", "format": "email"},
+        "age": {"type": "integer", "minimum": 18},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+        "role": {"enum": ["admin", "user"]},
+    },
+    "additionalProperties": False,
+}
+
+
+@pytest.mark.parametrize("body, expected", [
+    ({"name": "Ann", "email": "ann@example.com"}, True),
+    ({"name": "Ann", "email": "ann@example.com", "age": 30, "tags": ["a"], "role": "user"}, True),
+    ({"name": "Ann"}, False),
+    ({"name": "", "email": "ann@example.com"}, False),
+    ({"name": "Ann", "email": "ann@example.com", "age": 17}, False),
+    ({"name": "Ann", "email": "ann@example.com", "age": True}, False),
+    ({"name": "Ann", "email": "ann@example.com", "tags": ["a", 1]}, False),
+    ({"name": "Ann", "email": "ann@example.com", "tags": ["a", "b", "c"]}, False),
+    ({"name": "Ann", "email": "ann@example.com", "role": "root"}, False),
+    ({"name": "Ann", "email": "ann@example.com", "extra": 1}, False),
+    (["not", "an", "object"], False),
+])
+def test_generated_check_matches_schema(body, expected):
+    check = compile_check(USER_SCHEMA)
+    assert check is not None
+    assert check(body) is expected
+
+
+@pytest.mark.parametrize("schema", [
+    {"$ref": "#/definitions/user"},
+    {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+    {"type": "object", "patternProperties": {"^x-": {}}},
+    {"type": "object", "additionalProperties": {"type": "string"}},
+    {"type": "array", "items": [{"type": "string"}]},
+    {"enum": [{"nested": True}]},
+])
+def test_unsupported_schemas_are_left_to_jsonschema(schema):
+    assert compile_check(schema) is None
+
+
+def test_ambiguous_values_are_not_accepted():
+    # 1.0 is an integer in some drafts only, and True == 1 in Python
+    assert compile_check({"type": "integer"})(1.0) is False
+    assert compile_check({"enum": [1]})(True) is False
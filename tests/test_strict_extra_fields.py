@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+
+from schema.strict_validator import StrictSchemaValidator
+
+SCHEMA = {
+    "type": "object",
+    "required": ["a"],
+    "properties": {
+        "a": {"type": "integer"},
+        "n": {"type": "object", "additionalProperties": True, "properties": {"p": {"type": "string"}}},
+    },
+}
+
+
+def _extra_fields(response):
+    for error in response["error"]["errors"]:
+        if error["type"] == "extra_fields":
+            return error["details"]["extra_fields"]
+    return None
+
+
+def test_non_strict_mode_still_reports_undeclared_fields():
+    contract = SimpleNamespace(request_body_schema=SCHEMA)
+    body = {"a": "not an int", "zz": 1, "n": {"p": "x", "q": 2}}
+
+    valid, response = StrictSchemaValidator.validate_request(contract, body, strict=False)
+
+    assert not valid
+    assert _extra_fields(response) == ["zz", "n.q"]
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_valid_body_has_no_errors(strict):
+    contract = SimpleNamespace(request_body_schema=SCHEMA)
+    assert StrictSchemaValidator.validate_request(contract, {"a": 1, "n": {"p": "x"}}, strict=strict) == (True, None)
+
+
+def test_strict_mode_reads_extra_fields_from_the_error_pass(monkeypatch):
+    schema = {
+        "type": "object",
+        "required": ["a"],
+        "properties": {
+            "a": {"type": "integer"},
+            "n": {"type": "object", "properties": {"p": {"type": "string"}}},
+            "l": {"type": "array", "items": {"type": "object", "properties": {"x": {}}}},
+        },
+    }
+    contract = SimpleNamespace(request_body_schema=schema)
+    body = {"n": {"q": 1, "p": "x"}, "l": [{"y": 1}, {"x": 1, "w": 2}]}
+
+    def no_walk(*args, **kwargs):
+        raise AssertionError("payload walked a second time")
+
+    monkeypatch.setattr(StrictSchemaValidator, "find_extra_fields", staticmethod(no_walk))
+    valid, response = StrictSchemaValidator.validate_request(contract, body, strict=True)
+
+    assert not valid
+    assert response["error"]["errors"][0]["type"] == "required_violation"
+    assert _extra_fields(response) == ["n.q", "l[0].y", "l[1].w"]
@@ -1,11 +1,33 @@
 import os
 import json
 import uuid
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 
+def _entry_time(entry):
+    return entry["timestamp"]
+
+
+def _iso_bound(value, end=False):
+    """
+    Normalize a range bound to the ISO form entries are stamped with.
+
+    A date-only end bound ("2024-05-01" or a date) covers that whole day.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        value = datetime.fromtimestamp(value)
+    if not isinstance(value, str):
+        value = value.isoformat()
+    if end and len(value) == 10:
+        value += "T23:59:59.999999"
+    return value
+
+
 class SessionRecorder:
     def __init__(self, log_directory: str = "./session-logs", include_headers=True, include_body=True):
         self.log_directory = log_directory
@@ -51,6 +73,44 @@ class SessionRecorder:
         }
         self.active_session["entries"].append(entry)
 
+    def _iter_sessions(self):
+        active_id = self.active_session["id"] if self.active_session else None
+        for name in sorted(os.listdir(self.log_directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(self.log_directory, name), encoding="utf-8") as f:
+                    session = json.load(f)
+                # A saved copy of the active session is superseded by the live one
+                if session and session.get("id") != active_id:
+                    yield session
+        if self.active_session:
+            yield self.active_session
+
+    def get_sessions_in_period(self, start=None, end=None, endpoint=None):
+        """
+        Return recorded entries with start <= timestamp <= end, optionally for one path.
+
+        Entries are appended in time order and stamped with naive ISO strings,
+        which sort lexically, so each session is range-sliced by bisecting its
+        timestamps. Bounds may be ISO strings, datetimes, dates or epoch
+        seconds; a date-only end includes that whole day, and None leaves that
+        side open. A session that is active and also saved is counted once.
+        """
+        start, end = _iso_bound(start), _iso_bound(end, end=True)
+        matched = []
+        for session in self._iter_sessions():
+            entries = session.get("entries", [])
+            times = [_entry_time(entry) for entry in entries]
+            lo = bisect_left(times, start) if start is not None else 0
+            hi = bisect_right(times, end) if end is not None else len(entries)
+            if endpoint is None:
+                matched.extend(entries[lo:hi])
+            else:
+                matched.extend(e for e in entries[lo:hi] if e["path"] == endpoint)
+        return matched
+
+    def get_endpoint_usage(self, endpoint_path: str):
+        return self.get_sessions_in_period(endpoint=endpoint_path)
+
 
 def create_app():
     app = FastAPI()